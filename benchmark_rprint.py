@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Performance Benchmarks for ultimate_rprint
+==========================================
+
+Measures the costs that matter when ultimate_rprint is used from short-lived
+CLI workers and hot logging loops.
+
+Run: python benchmark_rprint.py
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import timeit
+
+# Rich modules that ultimate_rprint used to import eagerly
+EAGER_IMPORTS = (
+    "import rich.panel, rich.progress, rich.console, rich.text, rich.rule, rich.tree, "
+    "rich.table, rich.columns, rich.align, rich.syntax, rich.json, rich.status, "
+    "rich.prompt, rich.markdown, rich.box"
+)
+
+def _time_import(statement: str, runs: int) -> float:
+    """Median wall time (ms) of a statement in a fresh interpreter"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        samples.append(float(output.stdout.strip().splitlines()[-1]))
+    return statistics.median(samples)
+
+def bench_import_time(runs: int = 15):
+    """Import cost of `from ultimate_rprint import *` vs eager rich imports"""
+    eager = _time_import(EAGER_IMPORTS, runs)
+    lazy = _time_import("from ultimate_rprint import *", runs)
+    loaded = subprocess.run(
+        [sys.executable, "-c",
+         "import sys; from ultimate_rprint import *; "
+         "print(','.join(m for m in ('pygments', 'markdown_it', 'rich.progress') if m in sys.modules) or 'none')"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+
+    print(f"Import time (median of {runs} fresh interpreters)")
+    print(f"  eager rich imports:             {eager:8.1f} ms")
+    print(f"  from ultimate_rprint import *:  {lazy:8.1f} ms")
+    print(f"  heavy modules loaded on import: {loaded}")
+
+def bench_message_latency(calls: int = 20000):
+    """Per-call latency of display_info: markup string vs pre-resolved styles"""
+    import ultimate_rprint
+
+    with open(os.devnull, "w") as devnull:
+        ultimate_rprint.console.file = devnull
+        ultimate_rprint.set_plain_output(False)
+        message = "Processed batch 42 of 100"
+        markup = timeit.timeit(lambda: ultimate_rprint.console.print(f"[blue]ℹ {message}[/blue]"), number=calls)
+        styled = timeit.timeit(lambda: ultimate_rprint.display_info(message), number=calls)
+        ultimate_rprint.set_plain_output(None)
+        ultimate_rprint.console.file = None
+
+    print(f"display_info latency ({calls} calls)")
+    print(f"  markup string:        {markup / calls * 1e6:8.2f} us/call")
+    print(f"  pre-resolved styles:  {styled / calls * 1e6:8.2f} us/call")
+
+def bench_filtered_debug(calls: int = 200000):
+    """Cost of a display_debug call that is filtered out by the level threshold"""
+    import ultimate_rprint
+
+    results = list(range(1000))
+    ultimate_rprint.set_level("info")
+    eager = timeit.timeit(lambda: ultimate_rprint.display_debug(f"results: {results}"), number=calls)
+    lazy = timeit.timeit(lambda: ultimate_rprint.display_debug(lambda: f"results: {results}"), number=calls)
+    ultimate_rprint.set_level("debug")
+
+    print(f"Filtered display_debug ({calls} calls, level=info)")
+    print(f"  f-string message:     {eager / calls * 1e6:8.2f} us/call")
+    print(f"  lazy message:         {lazy / calls * 1e6:8.2f} us/call")
+
+def bench_plain_throughput(rounds: int = 500):
+    """Throughput into /dev/null: rich layout vs the plain-text fast path"""
+    import ultimate_rprint as ur
+
+    rows = [{"name": f"user_{i}", "role": "admin" if i % 3 == 0 else "user", "score": i / 7} for i in range(8)]
+
+    def workload():
+        ur.display_info("Processing batch")
+        ur.display_status_update("Loaded records", 42)
+        ur.display_key_value({"session_id": "20250817_143022", "memories": 67}, "Session")
+        ur.display_table(rows, "Users")
+        ur.display_divider("Section")
+
+    with open(os.devnull, "w") as devnull:
+        ur.console.file = devnull
+        ur.set_plain_output(False)
+        rich_time = timeit.timeit(workload, number=rounds)
+        ur.set_plain_output(True)
+        plain_time = timeit.timeit(workload, number=rounds)
+        ur.set_plain_output(None)
+        ur.console.file = None
+
+    print(f"Mixed workload into /dev/null ({rounds} rounds of 5 calls)")
+    print(f"  rich rendering:       {rounds / rich_time:8.0f} rounds/s")
+    print(f"  plain-text fast path: {rounds / plain_time:8.0f} rounds/s")
+
+def bench_table_widths(sizes=(1000, 10000)):
+    """display_table render time: rich measurement vs fixed column widths"""
+    import ultimate_rprint as ur
+
+    columns = ("id", "patient", "condition", "medication", "score", "updated", "notes", "status")
+    print("display_table render time (8 columns)")
+    with open(os.devnull, "w") as devnull:
+        ur.console.file = devnull
+        ur.set_plain_output(False)
+        for size in sizes:
+            rows = [
+                {key: (i if key == "id" else f"{key}_{i} " * (1 + i % 3)) for key in columns}
+                for i in range(size)
+            ]
+            measured = timeit.timeit(lambda: ur.display_table(rows, "Bench", max_rows=size), number=1)
+            fixed = timeit.timeit(lambda: ur.display_table(rows, "Bench", max_rows=size, widths="auto"), number=1)
+            print(f"  {size:>6} rows  measured: {measured * 1000:8.1f} ms   fixed widths: {fixed * 1000:8.1f} ms")
+        ur.set_plain_output(None)
+        ur.console.file = None
+
+def bench_top_k(size: int = 1000000, k: int = 20):
+    """Top-k rows of a large list: full sorted() vs display_table's bounded heap"""
+    import ultimate_rprint as ur
+
+    rows = [{"id": i, "score": (i * 7919) % 100003} for i in range(size)]
+    with open(os.devnull, "w") as devnull:
+        ur.console.file = devnull
+        ur.set_plain_output(False)
+        full = timeit.timeit(
+            lambda: ur.display_table(sorted(rows, key=lambda row: row["score"], reverse=True)[:k], "Top", max_rows=k),
+            number=1)
+        heap = timeit.timeit(lambda: ur.display_table(rows, "Top", sort_by="score", descending=True, top_k=k), number=1)
+        ur.set_plain_output(None)
+        ur.console.file = None
+
+    print(f"Top {k} of {size:,} rows")
+    print(f"  sorted() then display_table: {full * 1000:8.1f} ms")
+    print(f"  sort_by/top_k heap:          {heap * 1000:8.1f} ms")
+
+def bench_json_limits(items: int = 2000):
+    """display_json render time for a large payload: in full, with max_items and with select"""
+    import ultimate_rprint as ur
+
+    payload = {"results": [{"id": i, "score": i / 3, "tags": ["a", "b"]} for i in range(items)]}
+    with open(os.devnull, "w") as devnull:
+        ur.console.file = devnull
+        ur.set_plain_output(False)
+        full = timeit.timeit(lambda: ur.display_json(payload, "Full"), number=1)
+        limited = timeit.timeit(lambda: ur.display_json(payload, "Limited", max_items=20), number=1)
+        selected = timeit.timeit(lambda: ur.display_json(payload, "Scores", select="results[*].score"), number=1)
+        ur.set_plain_output(None)
+        ur.console.file = None
+
+    print(f"display_json of {items:,} results")
+    print(f"  full document:        {full * 1000:8.1f} ms")
+    print(f"  max_items=20:         {limited * 1000:8.1f} ms")
+    print(f"  results[*].score:     {selected * 1000:8.1f} ms")
+
+def bench_json_backends(items: int = 100000):
+    """Parse + pretty-serialize of a large document with each installed JSON backend"""
+    import ultimate_rprint as ur
+
+    document = json.dumps({"results": [{"id": i, "score": i / 3, "tags": ["a", "b"]} for i in range(items)]})
+    print(f"JSON parse + serialize ({len(document) / 1e6:.1f} MB document)")
+    for name in ("json", "ujson", "orjson"):
+        try:
+            ur.set_json_backend(name)
+        except ImportError:
+            print(f"  {name:8} not installed")
+            continue
+        _, loads, dumps = ur._json()
+        elapsed = timeit.timeit(lambda: dumps(loads(document), indent=True), number=3) / 3
+        print(f"  {name:8} {elapsed * 1000:8.1f} ms")
+    ur.set_json_backend(None)
+
+def bench_json_file(items: int = 300000):
+    """Large JSON file: json.load + display_json(max_items) vs display_json_file"""
+    import tempfile
+    import tracemalloc
+    import ultimate_rprint as ur
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memories.json")
+        with open(path, "w") as file:
+            file.write('{"memories": [')
+            file.write(",".join(json.dumps({"id": i, "text": f"note {i} [follow-up]", "tags": ["a", "b"]})
+                                for i in range(items)))
+            file.write("]}")
+
+        def load_then_display():
+            with open(path) as file:
+                ur.display_json(json.load(file), "Loaded", max_items=20)
+
+        def stream():
+            ur.display_json_file(path, max_items=20)
+
+        with open(os.devnull, "w") as devnull:
+            ur.console.file = devnull
+            ur.set_plain_output(False)
+            print(f"JSON file ({os.path.getsize(path) / 1e6:.0f} MB)")
+            for name, workload in (("json.load + display_json", load_then_display), ("display_json_file", stream)):
+                elapsed = timeit.timeit(workload, number=1)
+                tracemalloc.start()
+                workload()
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+                print(f"  {name:26} {elapsed * 1000:8.1f} ms  peak {peak / 1e6:7.1f} MB")
+            ur.set_plain_output(None)
+            ur.console.file = None
+
+def bench_json_diff(items: int = 20000, changes: int = 50):
+    """Diff of two large documents: line diff of the serialized JSON vs display_json_diff"""
+    import copy
+    import difflib
+    import ultimate_rprint as ur
+
+    old = {"results": [{"id": i, "score": i / 3, "tags": ["a", "b"]} for i in range(items)]}
+    new = copy.deepcopy(old)
+    for i in range(0, items, items // changes):
+        new["results"][i]["score"] += 1
+
+    def line_diff():
+        before = json.dumps(old, indent=2).splitlines()
+        after = json.dumps(new, indent=2).splitlines()
+        ur.display_code("\n".join(difflib.unified_diff(before, after, lineterm="")), "diff")
+
+    with open(os.devnull, "w") as devnull:
+        ur.console.file = devnull
+        ur.set_plain_output(False)
+        text = timeit.timeit(line_diff, number=1)
+        structural = timeit.timeit(lambda: ur.display_json_diff(old, new, max_changes=20), number=1)
+        ur.set_plain_output(None)
+        ur.console.file = None
+
+    print(f"Diff of {items:,} records with {changes} changes")
+    print(f"  difflib on json.dumps:  {text * 1000:8.1f} ms")
+    print(f"  display_json_diff:      {structural * 1000:8.1f} ms")
+
+def main():
+    """Run all benchmarks"""
+    bench_import_time()
+    print()
+    bench_message_latency()
+    print()
+    bench_filtered_debug()
+    print()
+    bench_plain_throughput()
+    print()
+    bench_table_widths()
+    print()
+    bench_top_k()
+    print()
+    bench_json_limits()
+    print()
+    bench_json_backends()
+    print()
+    bench_json_file()
+    print()
+    bench_json_diff()
+
+if __name__ == "__main__":
+    main()
@@ -5,8 +5,26 @@ Demonstrates all available functions with sample data
 """
 
 from ultimate_rprint import *
+import asyncio
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
 import time
 
+def captured_lines(func, *args, **kwargs):
+    """Plain-text output lines of func(*args, **kwargs), which is also shown as usual"""
+    ring = RingBufferSink()
+    add_sink(ring)
+    try:
+        func(*args, **kwargs)
+    finally:
+        remove_sink(ring)
+    return "\n".join(ring.lines()).splitlines()
+
 def test_basic_messages():
     """Test basic message types"""
     display_header("Basic Message Types")
@@ -17,6 +35,19 @@ def test_basic_messages():
     display_error("Something went wrong")
     display_debug("Debug information here")
     display_progress_msg("Processing data...")
+    display_info("Inline markup still works: [bold]bold[/bold] and [italic]italic[/italic]")
+    # Emoji codes are replaced with or without markup in the message
+    assert captured_lines(display_info, "Done :rocket: with 42 items") == ["ℹ Done 🚀 with 42 items"]
+    assert captured_lines(display_info, "[bold]Done[/bold] :rocket:") == ["ℹ Done 🚀"]
+    display_separator()
+
+def test_color_prints():
+    """Test direct color replacements"""
+    display_header("Direct Color Replacements")
+    
+    for print_color in (print_green, print_red, print_yellow, print_blue,
+                        print_cyan, print_magenta, print_dim, print_bold):
+        print_color(f"{print_color.__name__} message")
     display_separator()
 
 def test_research_pipeline():
@@ -66,6 +97,332 @@ def test_panels_and_banners():
     display_separator()
     display_completion_banner(150)
 
+def test_streaming_table():
+    """Test tables built from generators without materializing them"""
+    display_header("Streaming Tables")
+    
+    memories = ({"id": i, "patient": f"Patient {i}", "score": round(1 - i / 100000, 4)} for i in range(100000))
+    display_table(memories, "Memory Stream", max_rows=5)
+    
+    cursor = iter([{"id": i, "status": "active"} for i in range(50)])
+    display_table(cursor, "Uncounted Cursor", max_rows=5, count_rows=False)
+    
+    for empty in (None, [], iter([]), 42):
+        assert captured_lines(display_table, empty, "Empty")[-1].endswith("No data for table")
+    display_separator()
+
+def test_columnar_table():
+    """Test tables from column-oriented data"""
+    display_header("Columnar Tables")
+    
+    columns = {"patient": ["Elena", "Marcus", "Sarah"], "age": [34, 71, 58], "score": [0.87, 0.82, 0.79]}
+    display_table(columns, "Dict of Lists", max_rows=2)
+    
+    ragged = {"patient": ["Elena", "Marcus", "Sarah"], "age": [34]}
+    lines = captured_lines(display_table, ragged, "Ragged Columns")
+    assert any("Sarah" in line for line in lines)
+    
+    try:
+        import pandas as pd
+        display_table(pd.DataFrame({"memory_id": range(1000), "score": [i / 1000 for i in range(1000)]}), "DataFrame", max_rows=3)
+        # Missing cells are empty and sort last, like pyarrow nulls
+        gaps = pd.DataFrame({"seen": pd.to_datetime(["2025-08-17", None, "2025-08-18"]), "score": [0.5, None, 0.9]})
+        lines = captured_lines(display_table, gaps, "DataFrame With Gaps", sort_by="score", descending=True)
+        assert [line.split()[-1] for line in lines[3:5]] == ["0.9", "0.5"] and lines[5].strip() == ""
+        lines = captured_lines(display_table, gaps, "DataFrame With Gaps", summary=True)
+        assert lines[3].split()[:4] == ["seen", "other", "2", "1"]
+    except ImportError:
+        display_info("pandas not installed - skipping DataFrame example")
+    display_separator()
+
+def test_heterogeneous_table():
+    """Test column inference over rows with different keys"""
+    display_header("Heterogeneous Rows")
+    
+    responses = [
+        {"id": 1, "status": "ok"},
+        {"id": 2, "status": "error", "error_code": 503},
+        {"id": 3, "status": "ok", "latency_ms": 12.5, "cached": True},
+    ]
+    lines = captured_lines(display_table, responses, "API Responses")
+    assert lines[1].split() == ["Id", "Status", "Error", "Code", "Latency", "Ms", "Cached"]
+    
+    # A key that only appears in the last row is still a column
+    rows = [{"id": i} for i in range(5000)] + [{"id": 5000, "retry": True}]
+    assert captured_lines(display_table, rows, "Late Key", max_rows=2)[1].split() == ["Id", "Retry"]
+    assert captured_lines(display_table, iter(rows), "Late Key", max_rows=2)[1].split() == ["Id", "Retry"]
+    display_separator()
+
+def test_fixed_width_table():
+    """Test fixed column widths with fast truncation"""
+    display_header("Fixed-Width Tables")
+    
+    rows = [{"memory": f"Patient {i} reported symptoms consistent with type 2 diabetes", "score": i / 10} for i in range(5)]
+    display_table(rows, "Auto Widths From Sample", widths="auto")
+    display_table(rows, "Explicit Widths", widths={"memory": 24, "score": 6})
+    
+    # A one-cell column holds only the ellipsis
+    lines = captured_lines(display_table, rows, "One-Cell Column", widths={"memory": 1, "score": 6})
+    assert [line.split()[0] for line in lines[3:]] == ["…"] * 5
+    display_separator()
+
+def test_live_table():
+    """Test a table that updates as search results stream in"""
+    display_header("Live Table")
+    
+    with LiveTable("Streaming Search Results", key="memory_id", max_fps=20) as live:
+        for i in range(8):
+            live.append({"memory_id": i, "patient": f"Patient {i}", "score": 0.5, "status": "pending"})
+            time.sleep(0.02)
+        for i in range(0, 8, 2):
+            live.update(i, score=round(0.9 - i / 20, 2), status="ranked")
+            time.sleep(0.02)
+        live.remove(7)
+    
+    # Line breaks and tabs in a cell must not break the borders
+    from rich.console import Console
+    table = LiveTable("Control Characters")
+    table.append({"memory_id": 1, "note": "first line\nsecond line\tindented"})
+    table.append({"memory_id": 2, "note": "plain"})
+    output = io.StringIO()
+    Console(file=output, width=100).print(table)
+    lines = output.getvalue().splitlines()[1:]
+    assert len(lines) == 6 and len({len(line) for line in lines}) == 1
+    assert "first line↵second line" in output.getvalue()
+    display_separator()
+
+def test_table_pager():
+    """Test the paged table viewer (shows the first page when not interactive)"""
+    display_header("Paged Table Viewer")
+    
+    rows = ({"row": i, "memory": f"memory_{i}", "score": i % 100 / 100} for i in range(1_000_000))
+    if sys.stdin.isatty():
+        display_info("Use n/p to page, a row number to jump, q to quit")
+    display_table_pager(rows, "Million Row Stream", page_size=5)
+    display_separator()
+
+def test_top_k_table():
+    """Test showing the best rows of a large stream without sorting it"""
+    display_header("Top-K Table")
+    
+    rows = ({"memory_id": i, "patient": f"Patient {i % 40}", "score": (i * 7919) % 100003 / 100003}
+            for i in range(200000))
+    lines = captured_lines(display_table, rows, "Best Matches", sort_by="score", descending=True, top_k=5)
+    best = sorted(range(200000), key=lambda i: -((i * 7919) % 100003))[:5]
+    assert [int(line.split()[0]) for line in lines[3:-1]] == best
+    assert lines[-1].strip() == "Top 5 of 200,000 rows by score (descending)"
+    
+    # Rows without a value come last in either direction
+    rows = [{"name": "b", "age": 40}, {"name": "a"}, {"name": "c", "age": 25}]
+    lines = captured_lines(display_table, rows, "Youngest First", sort_by="age")
+    assert [line.split()[0] for line in lines[3:-1]] == ["c", "b", "a"]
+    rows = [{"id": i, "score": score} for i, score in enumerate([0.1, float("nan"), 0.9, 0.5, float("nan"), 0.7])]
+    lines = captured_lines(display_table, rows, "Highest Scores", sort_by="score", descending=True, top_k=3)
+    assert [line.split()[1] for line in lines[3:-1]] == ["0.9", "0.7", "0.5"]
+    lines = captured_lines(display_table, rows, "Lowest Scores", sort_by="score")
+    assert [line.split()[1] for line in lines[3:-1]] == ["0.1", "0.5", "0.7", "0.9", "nan", "nan"]
+    display_separator()
+
+def test_cell_formatters():
+    """Test type-aware cell formatting, per column and per type"""
+    import datetime
+    display_header("Cell Formatters")
+    
+    rows = [
+        {"memory_id": i, "score": i / 7, "created": datetime.datetime(2025, 8, 17, 14, 30, i),
+         "embedding": bytes(range(i, i + 12)), "metadata": {"source": "notes", "page": i, "tags": ["a"], "lang": "en"}}
+        for i in range(4)
+    ]
+    display_table(rows, "Default Formatting")
+    display_table(rows, "Per Column", formatters={"score": ".1%", "memory_id": lambda value: f"M-{value:04d}"})
+    
+    set_formatter(datetime.datetime, lambda value: value.strftime("%H:%M:%S"))
+    try:
+        display_table(rows, "Times Only")
+    finally:
+        set_formatter(datetime.datetime, None)
+    
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        rows = [{"memory_id": 1, "embedding": np.arange(3)}, {"memory_id": 2, "embedding": None}]
+        assert any("[0 1 2]" in line for line in captured_lines(display_table, rows, "Array Cells"))
+    display_separator()
+
+def test_grouped_table():
+    """Test group-by aggregation with subtotal rows"""
+    display_header("Grouped Table")
+    
+    rows = (
+        {"ward": "ABC"[i % 3], "condition": ("diabetes", "hypertension", "asthma", "copd")[i % 4],
+         "score": i % 10 / 10, "age": 20 + i % 60}
+        for i in range(10000)
+    )
+    lines = captured_lines(display_table, rows, "Memories per Ward and Condition", group_by=["ward", "condition"],
+                           aggregate={"memories": "count", "score": "mean", "oldest": ("age", "max")},
+                           subtotals=True)
+    cells = [line.split() for line in lines[3:-1]]
+    assert ["A", "diabetes", "834", "0.3995", "68"] in cells
+    assert [["A", "Subtotal", "3334", "0.45", "77"], ["B", "Subtotal", "3333", "0.45", "78"],
+            ["C", "Subtotal", "3333", "0.45", "79"]] == [row for row in cells if row[1:2] == ["Subtotal"]]
+    assert cells[-1] == ["Total", "10000", "0.45", "79"]
+    assert lines[-1].strip() == "12 groups from 10,000 rows"
+    
+    rows = [{"condition": "diabetes"}, {"condition": "asthma"}, {"condition": "diabetes"}]
+    lines = captured_lines(display_table, rows, "Most Common Conditions", group_by="condition", sort_by="count",
+                           descending=True)
+    assert [line.split() for line in lines[3:-1]] == [["diabetes", "2"], ["asthma", "1"]]
+    
+    # High-cardinality keys are capped at max_rows groups
+    rows = [{"patient": f"Patient {i % 1000}", "score": i % 7} for i in range(5000)]
+    lines = captured_lines(display_table, rows, "Per Patient", max_rows=5, group_by="patient",
+                           aggregate={"memories": "count", "score": "max"})
+    assert any("Patient 4 " in line for line in lines) and not any("Patient 5 " in line for line in lines)
+    assert any("… 995 more groups" in line for line in lines)
+    assert lines[-1].strip() == "1,000 groups from 5,000 rows"
+    lines = captured_lines(display_table, rows, "Top Patients", group_by="patient", sort_by="memories",
+                           descending=True, top_k=3, aggregate={"memories": "count"})
+    assert any("… 997 more groups" in line for line in lines)
+    display_separator()
+
+def test_table_summary():
+    """Test per-column statistics instead of raw rows"""
+    display_header("Table Summary")
+    
+    rows = (
+        {"memory_id": i, "patient": f"Patient {i % 40}", "score": i % 100 / 100,
+         "condition": None if i % 9 == 0 else ("diabetes", "hypertension", "asthma")[i % 3]}
+        for i in range(20000)
+    )
+    lines = captured_lines(display_table, rows, "Memory Search Results", summary=True)
+    stats = {line.split()[0]: line.split() for line in lines[3:-1]}
+    assert stats["score"][:9] == ["score", "number", "20000", "0", "0.0", "0.99", "0.495", "0.2887", "100"]
+    assert stats["patient"][2:4] == ["20000", "0"] and stats["patient"][8] == "40"
+    assert stats["condition"][2:4] == ["17777", "2223"]
+    # Distinct counts past the exact limit are estimates
+    estimate = int(stats["memory_id"][8].lstrip("~").replace(",", ""))
+    assert stats["memory_id"][8].startswith("~") and abs(estimate - 20000) < 2000
+    assert lines[-1].strip() == "20,000 rows"
+    
+    # Sample standard deviation of 34, 51, 29 and 67 is sqrt(896.75 / 3)
+    lines = captured_lines(display_table, {"age": [34, 51, 29, 67, None], "ward": ["A", "B", "A", "C", "A"]},
+                           "Patients", summary=True)
+    assert lines[3].split() == ["age", "number", "4", "1", "29", "67", "45.25", "17.2892", "4"]
+    assert lines[4].split() == ["ward", "str", "5", "0", "A", "C", "3", "A", "(3)"]
+    # Exact counts do not merge values that share a hash
+    lines = captured_lines(display_table, [{"offset": -1}, {"offset": -2}], "Offsets", summary=True)
+    assert lines[3].split()[8] == "2"
+    display_separator()
+
+def test_json_limits():
+    """Test collapsing deep, long and wide parts of a large JSON payload"""
+    display_header("Large JSON Payload")
+    
+    response = {
+        "query": {"text": "chest pain " * 40, "filters": {"ward": {"in": ["A", "B"]}}},
+        "results": [{"memory_id": i, "score": round(1 - i / 50000, 4), "tags": ["cardiology", "urgent"]}
+                    for i in range(50000)],
+    }
+    lines = [line.strip() for line in
+             captured_lines(display_json, response, "Search Response", max_depth=3, max_items=3, max_string=30)]
+    assert '"text": "chest pain chest pain chest pa… (440 chars)",' in lines
+    assert '"ward": "{… 1 key}"' in lines
+    assert lines.count('"tags": "[… 2 items]"') == 3 and '"… 49,997 more items"' in lines
+    lines = [line.strip() for line in captured_lines(display_json, {f"k{i}": i for i in range(10)}, "Wide", max_items=3)]
+    assert lines[2:6] == ['"k0": 0,', '"k1": 1,', '"k2": 2,', '"…": "7 more keys"']
+    display_separator()
+
+def test_json_select():
+    """Test rendering only the nodes matched by a path expression"""
+    display_header("JSON Path Selection")
+    
+    response = {
+        "status": "ok",
+        "results": [{"memory_id": i, "score": round(1 - i / 1000, 4), "meta": {"ward": "A" if i % 2 else "B"}}
+                    for i in range(1000)],
+    }
+    display_json(response, "Scores", select="results[*].score", max_items=5)
+    display_json(response, "Last Result", select="results[-1]")
+    display_json(response, "Wards", select="results[10:13]..ward")
+    display_json(response, "Missing", select="results[*].text")
+    assert any('"None": 1' in line for line in captured_lines(display_json, {None: 1, (1, 2): 2}, select="*"))
+    display_separator()
+
+def test_json_backends():
+    """Test non-standard values in display_json with each installed JSON backend"""
+    import dataclasses
+    import datetime
+    import uuid
+    display_header("JSON Backends")
+    
+    @dataclasses.dataclass
+    class Memory:
+        memory_id: int
+        patient: str
+    
+    record = {"id": uuid.UUID(int=42), "created": datetime.datetime(2025, 8, 17, 14, 30),
+              "memory": Memory(7, "Patient 7"), "tags": {"cardiology"}}
+    expected = {"id": "00000000-0000-0000-0000-00000000002a", "created": "2025-08-17T14:30:00",
+                "memory": {"memory_id": 7, "patient": "Patient 7"}, "tags": ["cardiology"]}
+    for backend in ("json", "ujson", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ImportError:
+            print_dim(f"{backend} is not installed")
+            continue
+        lines = captured_lines(display_json, record, f"Record ({backend})")
+        assert json.loads("\n".join(lines[1:])) == expected, backend
+    set_json_backend(None)
+    try:
+        set_json_backend("bogus")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown JSON backend accepted")
+    display_json('{"status": "ok", "count": 2}', "Parsed String")
+    display_separator()
+
+def test_json_file():
+    """Test displaying a large JSON file without loading it"""
+    display_header("JSON File")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memories.json")
+        with open(path, "w") as file:
+            file.write('{"version": 3, "memories": [')
+            file.write(",".join(json.dumps({"memory_id": i, "text": f"note {i}: \\\"quoted\\\" [x]",
+                                            "tags": ["a", "b"]}) for i in range(20000)))
+            file.write('], "source": "export"}')
+        lines = [line.strip() for line in captured_lines(display_json_file, path, max_depth=3, max_items=3)]
+        assert lines.count('"tags": "[… 2 items]"') == 3
+        assert '"memory_id": 2,' in lines and '"memory_id": 3,' not in lines
+        assert '"… 19,997 more items"' in lines and '"source": "export"' in lines
+        assert r'"text": "note 0: \\\"quoted\\\" [x]",' in lines
+        lines = captured_lines(display_json_file, os.path.join(directory, "missing.json"))
+        assert lines[0].startswith("Cannot display JSON file")
+    display_separator()
+
+def test_json_diff():
+    """Test structural diff of two JSON documents"""
+    display_header("JSON Diff")
+    
+    old = {"status": "ok", "results": [{"id": 1, "score": 0.5}, {"id": 2, "score": 0.7}, {"id": 3, "score": 0.9}],
+           "config": {"model": "small", "limits": [10, 20]}, "tags": ["a", "b"]}
+    new = {"status": "ok", "results": [{"id": 2, "score": 0.75}, {"id": 1, "score": 0.5}, {"id": 4, "score": 0.1}],
+           "config": {"model": "large", "limits": [10]}, "cached": True, "tags": ["z", "a", "b"]}
+    lines = [line.strip() for line in captured_lines(display_json_diff, old, new, "API v1 vs v2")]
+    for entry in ("+ cached: true", '- [id=3]: {"id":3,"score":0.9}', '+ [id=4]: {"id":4,"score":0.1}',
+                  "~ score: 0.7 → 0.75", '~ model: "small" → "large"', "- [1]: 20", '+ [0]: "z"'):
+        assert entry in lines, entry
+    assert lines[-1] == "3 added, 2 removed, 2 changed"
+    assert len(lines) == 14  # the inserted tag is one addition, not three changes
+    lines = captured_lines(display_json_diff, old, new, "First 2 Changes", max_changes=2)
+    assert lines[-2].strip() == "… 5 more changes"
+    display_json_diff('{"a": [1, 2]}', '{"a": [1, 2]}', "Unchanged")
+    display_separator()
+
 def test_execution_summary():
     """Test execution summary"""
     display_header("Execution Summary")
@@ -117,17 +474,260 @@ def test_error_handling():
     display_fallback_notice("Using direct mem0 search instead of ID tracker")
     display_error_panel("Critical system failure detected")
 
+def test_level_threshold():
+    """Test level filtering and lazy messages"""
+    display_header("Level Threshold")
+    
+    evaluated = []
+    def expensive_dump():
+        evaluated.append(True)
+        return "memory search results: " + ", ".join(f"memory_{i}" for i in range(5))
+    
+    set_level("info")
+    display_debug(expensive_dump)
+    display_log(expensive_dump, level="debug")
+    assert not evaluated, "filtered lazy messages must not be evaluated"
+    display_info("Debug output hidden at level 'info'")
+    
+    set_level("debug")
+    display_debug(expensive_dump)
+    display_log(lambda: "Lazy message shown once the level allows it", level="debug")
+    display_separator()
+
+def test_coalescing():
+    """Test merging high-frequency status messages"""
+    display_header("Coalescing and Rate Limiting")
+    
+    enable_coalescing(window=0.1, max_lines_per_second=50)
+    start = time.monotonic()
+    processed = 0
+    while time.monotonic() - start < 0.25:
+        display_memory_search_start(f"memory {processed}")
+        display_status_update("Memories scanned", processed)
+        processed += 1
+    disable_coalescing()
+    display_success(f"{processed} search/status pairs merged into a handful of lines")
+    
+    def burst(rate, count):
+        enable_coalescing(window=5, max_lines_per_second=rate)
+        for i in range(count):
+            display_progress_msg(f"Step {i}")
+        disable_coalescing()
+    
+    for rate in (0.5, 1):
+        assert captured_lines(burst, rate, 5) == ["▶ Step 0", "... 4 status lines suppressed (rate limit)"]
+    assert captured_lines(burst, 3, 6) == ["▶ Step 0", "▶ Step 1", "▶ Step 2",
+                                           "... 3 status lines suppressed (rate limit)"]
+    
+    def quiet():
+        enable_coalescing(window=0.1)
+        for _ in range(3):
+            display_progress_msg("Repeated then quiet")
+        time.sleep(0.35)
+    
+    lines = captured_lines(quiet)
+    disable_coalescing()
+    assert len(lines) == 2 and lines[1].startswith("▶ Repeated then quiet (x2 in ")
+    display_separator()
+
+def test_batched_output():
+    """Test collecting many display calls into one terminal write"""
+    display_header("Batched Output")
+    
+    with display_batch():
+        for i in range(1, 4):
+            display_step_progress(i, 3, f"Batch item {i}")
+            display_connection_item(i, f"Patient {i}", 0.9 - i / 10, "Buffered until the batch exits")
+        display_status_update("Batched items written", 3)
+    
+    @display_batch(max_items=2)
+    def report():
+        display_info("Decorated function output is batched too")
+        display_status_update("Flushed every 2 entries", 2)
+        display_success("Final flush on return")
+    
+    report()
+    
+    ring = RingBufferSink()
+    add_sink(ring)
+    try:
+        with display_batch(max_seconds=0.05):
+            display_info("A quiet batch is flushed on time")
+            time.sleep(0.3)
+            assert len(ring.lines()) == 1
+            display_info("flush_output() flushes the active batch")
+            flush_output()
+            assert len(ring.lines()) == 2
+    finally:
+        remove_sink(ring)
+    
+    stream = io.StringIO()
+    display_replacement("[green]Written to an explicit stream[/green]", file=stream, flush=True)
+    assert stream.getvalue() == "Written to an explicit stream\n"
+    display_separator()
+
+def test_async_output():
+    """Test writing output from a background thread"""
+    display_header("Background Writer")
+    
+    enable_async_output(max_queue=100, overflow="drop-debug")
+    for i in range(1, 4):
+        display_progress_msg(f"Queued message {i}")
+    display_debug("Debug messages are dropped first when the queue is full")
+    flush_output()
+    
+    # A render error is reported, not counted as a dropped message
+    errors = io.StringIO()
+    with contextlib.redirect_stderr(errors):
+        lines = captured_lines(lambda: (display_replacement("[bold]Mismatched[/italic]"), flush_output()))
+    assert "MarkupError" in errors.getvalue()
+    assert not any("dropped" in line for line in lines)
+    disable_async_output()
+    display_success("Queue drained and writer stopped")
+    
+    exit_check = (
+        "from ultimate_rprint import *; enable_async_output(overflow='drop-oldest'); "
+        "[display_info(f'line {i}') for i in range(200)]"
+    )
+    result = subprocess.run([sys.executable, "-c", exit_check], check=True, capture_output=True, text=True)
+    assert result.stdout.count("line") == 200
+    display_success("Pending output flushed at interpreter exit")
+    display_separator()
+
+def test_asyncio_api():
+    """Test coroutine versions of the display helpers"""
+    display_header("Asyncio API")
+    
+    async def pipeline():
+        await aio.adisplay_info("Awaitable info message")
+        await aio.adisplay_status_update("Memories processed", 12)
+        async with aio.adisplay_spinner("Waiting on the event loop"):
+            await asyncio.sleep(0.2)
+        await aio.adisplay_countdown(1, "Async countdown")
+        await aio.adisplay_success("Event loop never blocked")
+    
+    asyncio.run(pipeline())
+    # Context managers and blocking helpers have no generic coroutine twin, and only "a" prefixes resolve
+    for name in ("adisplay_batch", "adisplay_table_pager", "adisplay_json_file", "zdisplay_info", "xprint_red"):
+        assert not hasattr(aio, name), name
+    display_separator()
+
+def test_plain_output():
+    """Test the plain-text renderer used for non-interactive output"""
+    display_header("Plain Text Output")
+    
+    set_plain_output(True)
+    display_info("Plain messages carry no ANSI codes")
+    display_key_value({"session_id": "20250817_143022", "memories": 67}, "Plain Panel")
+    display_table([{"name": "Alice", "role": "admin"}, {"name": "Bob", "role": "user"}], "Plain Table")
+    display_tree({"diabetes": ["metformin", "insulin"]}, "Plain Tree")
+    display_json({"status": "ok", "count": 2}, "Plain JSON")
+    display_divider("Plain Divider")
+    headless = Table(title="Headless Table", show_header=False)
+    headless.add_column("Key")
+    headless.add_column("Value")
+    headless.add_row("status", "ok")
+    assert captured_lines(display_replacement, headless) == ["Headless Table", "status  ok"]
+    set_plain_output(None)
+    display_separator()
+
+def test_json_output():
+    """Test JSON-lines records alongside terminal output"""
+    display_header("JSON Lines Output")
+    
+    records = io.StringIO()
+    enable_json_output(records)
+    display_status_update("Stored medical facts", 7)
+    display_connection_item(1, "Elena Vance", 0.87, "Elena Vance has type 2 diabetes")
+    display_api_error("Failed to connect to Mem0 API")
+    disable_json_output()
+    
+    lines = [json.loads(line) for line in records.getvalue().splitlines()]
+    assert [record["func"] for record in lines] == ["display_status_update", "display_connection_item", "display_api_error"]
+    assert lines[0]["count"] == 7 and lines[1]["score"] == 0.87 and lines[2]["level"] == "error"
+    display_code(records.getvalue(), "json", "Emitted Records")
+    display_separator()
+
+def test_output_sinks():
+    """Test rendering once and fanning out to several sinks"""
+    display_header("Output Sinks")
+    
+    ring = RingBufferSink(maxlen=3)
+    with tempfile.TemporaryDirectory() as directory:
+        log_path = os.path.join(directory, "display.log")
+        log_file = FileSink(log_path, max_bytes=1024 * 1024)
+        add_sink(ring)
+        add_sink(log_file)
+        display_info("Written to the terminal, the log file and the ring buffer")
+        display_key_value({"session_id": "20250817_143022", "memories": 67}, "Session")
+        display_success("Rendered once for all destinations")
+        remove_sink(ring)
+        remove_sink(log_file)
+        
+        assert ring.lines()[-1].endswith("Rendered once for all destinations")
+        with open(log_path, encoding="utf-8") as handle:
+            assert "Session" in handle.read()
+        # max_bytes counts encoded bytes, not characters
+        assert log_file.size == os.path.getsize(log_path)
+    display_list(ring.lines(), "Ring Buffer Contents")
+    # print() options still apply with a sink attached
+    lines = captured_lines(display_replacement, "Literal [bold]markup[/bold]", markup=False, style="red")
+    assert lines == ["Literal [bold]markup[/bold]"]
+    display_separator()
+
+def test_lazy_imports():
+    """Test that heavy rich components load only on first use"""
+    display_header("Lazy Imports")
+    
+    check = (
+        "import sys; from ultimate_rprint import *; display_info('hello'); "
+        "assert 'pygments' not in sys.modules and 'markdown_it' not in sys.modules; "
+        "Panel, Table, Tree, Prompt, Confirm, ROUNDED; "
+        "from datetime import datetime; from ultimate_rprint import *; assert isinstance(datetime, type)"
+    )
+    subprocess.run([sys.executable, "-c", check], check=True, capture_output=True)
+    display_success("pygments and markdown-it not loaded by display_info")
+    
+    display_code("print('loaded on demand')", "python", "Lazy Syntax")
+    display_markdown("**Markdown** loaded on demand")
+    display_separator()
+
 def main():
     """Run all tests"""
     display_welcome_banner()
     
     test_basic_messages()
+    test_color_prints()
     test_research_pipeline()
     test_patient_display()
     test_panels_and_banners()
+    test_streaming_table()
+    test_columnar_table()
+    test_heterogeneous_table()
+    test_fixed_width_table()
+    test_live_table()
+    test_table_pager()
+    test_top_k_table()
+    test_cell_formatters()
+    test_grouped_table()
+    test_table_summary()
+    test_json_limits()
+    test_json_select()
+    test_json_backends()
+    test_json_file()
+    test_json_diff()
     test_execution_summary()
     test_pipeline_flow()
     test_error_handling()
+    test_level_threshold()
+    test_coalescing()
+    test_batched_output()
+    test_async_output()
+    test_asyncio_api()
+    test_plain_output()
+    test_json_output()
+    test_output_sinks()
+    test_lazy_imports()
     
     display_divider("Testing Complete")
     display_success("All rprint helper functions tested successfully!")
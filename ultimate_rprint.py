@@ -53,69 +53,2564 @@ GITHUB READY:
 """
 
 from rich import print as rprint
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
+from rich.cells import cell_len
 from rich.console import Console
 from rich.text import Text
-from rich.rule import Rule
-from rich.tree import Tree
-from rich.table import Table
-from rich.columns import Columns
-from rich.align import Align
-from rich.syntax import Syntax
-from rich.json import JSON
-from rich.status import Status
-from rich.prompt import Prompt, Confirm
-from rich.markdown import Markdown
-from rich.box import ROUNDED, DOUBLE, MINIMAL
+import atexit
+import functools
+import heapq
+import importlib
+import os
+import queue
+import sys
+import threading
 import time
+import traceback
 import json
 import contextlib
-from typing import Optional, List, Dict, Any, Union
+import dataclasses
+import datetime
+import itertools
+import mmap
+import numbers
+import operator
+import re
+from collections import deque, namedtuple
+from collections.abc import Mapping, Sequence
+from typing import Optional, List, Dict, Any, Union, Iterable, Callable
+
+# Heavier rich components are imported on first use, so a script that only calls
+# display_info() never loads pygments (Syntax) or markdown-it (Markdown).
+# They stay reachable as module attributes, e.g. ultimate_rprint.Panel.
+_LAZY_IMPORTS = {
+    "Panel": "rich.panel",
+    "Progress": "rich.progress",
+    "SpinnerColumn": "rich.progress",
+    "TextColumn": "rich.progress",
+    "BarColumn": "rich.progress",
+    "TimeElapsedColumn": "rich.progress",
+    "Rule": "rich.rule",
+    "Tree": "rich.tree",
+    "Table": "rich.table",
+    "Columns": "rich.columns",
+    "Align": "rich.align",
+    "Syntax": "rich.syntax",
+    "JSON": "rich.json",
+    "Status": "rich.status",
+    "Prompt": "rich.prompt",
+    "Confirm": "rich.prompt",
+    "Markdown": "rich.markdown",
+    "ROUNDED": "rich.box",
+    "DOUBLE": "rich.box",
+    "MINIMAL": "rich.box",
+}
+
+# Components that load pygments, markdown-it or the progress machinery are left
+# out of star-imports, which would otherwise import them eagerly
+_HEAVY_MODULES = ("rich.progress", "rich.syntax", "rich.markdown")
+
+def __getattr__(name: str):
+    """Import lazily exposed rich components on first attribute access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 console = Console()
 
 # ============================================================================
-# ENHANCED DATA DISPLAY
+# STYLE CACHE
+# ============================================================================
+
+@functools.lru_cache(maxsize=None)
+def _style(definition: str):
+    """Resolve a style definition against the console theme once and reuse it"""
+    return console.get_style(definition)
+
+def _styled_text(message: str, style: str, prefix: str = "") -> Text:
+    """Build a single-style Text, only running the markup parser if the message has markup.
+
+    Emoji codes are replaced and numbers highlighted either way, as rprint does.
+    """
+    message = str(message)
+    resolved = _style(style)
+    if "[" in message:
+        text = Text(prefix, style=resolved)
+        text.append_text(Text.from_markup(message))
+    else:
+        if ":" in message:
+            from rich.emoji import Emoji
+            message = Emoji.replace(message)
+        text = Text(prefix + message, style=resolved)
+    console.highlighter.highlight(text)
+    return text
+
+# ============================================================================
+# LEVELS
+# ============================================================================
+
+_LEVELS = {"debug": 10, "info": 20, "progress": 20, "success": 20, "warning": 30, "error": 40}
+_threshold = _LEVELS.get(os.environ.get("ULTIMATE_RPRINT_LEVEL", "debug").lower(), 0)
+
+def set_level(level: str):
+    """Hide every display call below level ("debug", "info", "warning", "error")"""
+    global _threshold
+    if level not in _LEVELS:
+        raise ValueError(f"level must be one of {tuple(_LEVELS)}, got {level!r}")
+    _threshold = _LEVELS[level]
+
+def is_enabled(level: str) -> bool:
+    """Whether display calls at level are currently shown"""
+    return _LEVELS.get(level, _LEVELS["info"]) >= _threshold
+
+def _leveled(level: str):
+    """Skip the helper before any formatting when level is below the threshold.
+
+    A helper whose first parameter is a str message also accepts a zero-argument
+    callable, which is only called when the message is actually shown.
+    """
+    value = _LEVELS[level]
+
+    def decorate(func):
+        code = func.__code__
+        params = code.co_varnames[:code.co_argcount]
+        lazy = params[0] if params and func.__annotations__.get(params[0]) is str else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if value < _threshold:
+                return None
+            if lazy is not None:
+                if args and callable(args[0]):
+                    args = (args[0](),) + args[1:]
+                elif callable(kwargs.get(lazy)):
+                    kwargs[lazy] = kwargs[lazy]()
+            if _json_sink is None:
+                return func(*args, **kwargs)
+            return _record_call(func, level, params, lazy, args, kwargs)
+
+        return wrapper
+    return decorate
+
+# ============================================================================
+# JSON BACKEND
 # ============================================================================
 
-def display_json(data: Union[Dict, List, str], title: str = "Data"):
-    """Display JSON with syntax highlighting"""
-    if isinstance(data, str):
+def _json_default(value: Any) -> Any:
+    """JSON form of values the encoder does not support natively; only called for those values"""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if hasattr(value, "tolist"):  # NumPy arrays and scalars
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value).decode("utf-8", "replace")
+    return str(value)  # UUID, Decimal, Path, enums, ...
+
+def _stdlib_dumps(data: Any, indent: bool = False) -> str:
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False, default=_json_default)
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=_json_default)
+
+def _orjson_backend():
+    import orjson
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    
+    def dumps(data, indent=False):
         try:
-            data = json.loads(data)
-        except json.JSONDecodeError:
-            rprint(f"[red]Invalid JSON string[/red]")
-            return
+            return orjson.dumps(data, default=_json_default,
+                                option=(options | orjson.OPT_INDENT_2) if indent else options).decode()
+        except TypeError:  # e.g. integers beyond 64 bits
+            return _stdlib_dumps(data, indent)
+    return orjson.loads, dumps
+
+def _ujson_backend():
+    import ujson
     
-    panel = Panel(JSON.from_data(data), title=f"[bold cyan]{title}[/bold cyan]", border_style="cyan")
-    rprint(panel)
+    def dumps(data, indent=False):
+        try:
+            return ujson.dumps(data, indent=2 if indent else 0, ensure_ascii=False, escape_forward_slashes=False,
+                               default=_json_default)
+        except (TypeError, OverflowError):
+            return _stdlib_dumps(data, indent)
+    return ujson.loads, dumps
+
+_JSON_BACKENDS = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "json": lambda: (json.loads, _stdlib_dumps),
+}
+_json_codec = None  # (name, loads, dumps), resolved on first use
+
+def set_json_backend(name: Optional[str] = None):
+    """Use "orjson", "ujson" or "json" (stdlib) to parse and serialize JSON; None picks the fastest installed"""
+    global _json_codec
+    if name is None:
+        _json_codec = None
+        return
+    if name not in _JSON_BACKENDS:
+        raise ValueError(f"JSON backend must be one of {tuple(_JSON_BACKENDS)}, got {name!r}")
+    _json_codec = (name,) + _JSON_BACKENDS[name]()
+
+def _json() -> tuple:
+    """(name, loads, dumps) of the JSON backend; dumps(data, indent=False) returns str"""
+    global _json_codec
+    if _json_codec is None:
+        for name, backend in _JSON_BACKENDS.items():
+            try:
+                _json_codec = (name,) + backend()
+                break
+            except ImportError:
+                continue
+    return _json_codec
 
-def display_table(data: List[Dict], title: str = "Table", max_rows: int = 10):
-    """Create table from list of dictionaries"""
-    if not data:
-        display_warning("No data for table")
+# ============================================================================
+# JSON LINES OUTPUT
+# ============================================================================
+
+_SCALARS = (str, int, float, bool, type(None))
+
+class _JsonLinesSink:
+    """Writes one compact JSON record per display call"""
+
+    def __init__(self, target: Any, pretty: bool):
+        self.pretty = pretty
+        self.owns_file = isinstance(target, (str, os.PathLike))
+        self.file = open(target, "a", encoding="utf-8", buffering=1) if self.owns_file else target
+        self.lock = threading.Lock()
+        self.dumps = _json()[2]
+
+    def write(self, record: Dict[str, Any]):
+        line = self.dumps(record) + "\n"
+        with self.lock:
+            self.file.write(line)
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+        else:
+            self.file.flush()
+
+_json_sink = None
+
+def _record_call(func, level: str, params: tuple, lazy: Optional[str], args: tuple, kwargs: Dict[str, Any]):
+    """Record the outermost display call to the JSON sink, then render it unless JSON-only"""
+    sink = _json_sink
+    depth = getattr(_local, "record_depth", 0)
+    if depth == 0:
+        bound = dict(zip(params, args))
+        bound.update(kwargs)
+        record = {"ts": time.time(), "level": level, "func": func.__name__}
+        if lazy is not None:
+            record["message"] = str(bound.pop(lazy, ""))
+        record.update((name, value) for name, value in bound.items() if isinstance(value, _SCALARS))
+        sink.write(record)
+    if not sink.pretty:
+        return None
+    _local.record_depth = depth + 1
+    try:
+        return func(*args, **kwargs)
+    finally:
+        _local.record_depth = depth
+
+def enable_json_output(target: Any, pretty: bool = True):
+    """Also write every display call as a JSON line to target (a path or a text stream).
+
+    Records hold ts, level, func, message and the call's scalar arguments
+    (count, score, ...). orjson is used when installed. With pretty=False
+    the terminal output is skipped and only the records are written.
+    """
+    global _json_sink
+    disable_json_output()
+    _json_sink = _JsonLinesSink(target, pretty)
+
+def disable_json_output():
+    """Stop writing JSON records and close a file opened by enable_json_output"""
+    global _json_sink
+    sink, _json_sink = _json_sink, None
+    if sink is not None:
+        sink.close()
+
+atexit.register(disable_json_output)
+
+# ============================================================================
+# OUTPUT AND BATCHING
+# ============================================================================
+
+_local = threading.local()
+
+def _write(entries: List[tuple]):
+    """Print (objects, kwargs) entries to the console with a single terminal write"""
+    if _sinks:
+        _write_to_sinks(entries)
+        return
+    if _use_plain():
+        _write_plain(entries)
+        return
+    if len(entries) == 1:
+        objects, kwargs = entries[0]
+        console.print(*objects, **kwargs)
+        return
+    with console:
+        for objects, kwargs in entries:
+            console.print(*objects, **kwargs)
+
+def _dispatch(entries: List[tuple], level: str = "info"):
+    """Hand entries to the background writer if one is running, else write them now"""
+    writer = _writer
+    if writer is None:
+        _write(entries)
+    else:
+        writer.submit(entries, level)
+
+def _dispatch_leveled(entries: List[tuple]):
+    """Dispatch (objects, kwargs, level) entries, each run of one level with that level"""
+    for level, run in itertools.groupby(entries, key=operator.itemgetter(2)):
+        _dispatch([(objects, kwargs) for objects, kwargs, _ in run], level)
+
+def _emit(*objects, level: str = "info", **kwargs):
+    """Send renderables to the active batch, or on to the console"""
+    batch = getattr(_local, "batch", None)
+    if batch is not None:
+        batch.add(objects, kwargs, level)
+    else:
+        _dispatch([(objects, kwargs)], level)
+
+class _OutputBatch:
+    """Pending output that is flushed once it holds too many entries or gets too old"""
+
+    def __init__(self, max_items: int, max_seconds: Optional[float]):
+        self.max_items = max_items
+        self.max_seconds = max_seconds
+        self.entries = []
+        self.started = time.monotonic()
+        self.lock = threading.RLock()
+        self.timer = None
+
+    def add(self, objects: tuple, kwargs: Dict[str, Any], level: str = "info"):
+        with self.lock:
+            if not self.entries:
+                self.started = time.monotonic()
+            self.entries.append((objects, kwargs, level))
+            if len(self.entries) >= self.max_items or (
+                self.max_seconds is not None and time.monotonic() - self.started >= self.max_seconds
+            ):
+                self.flush()
+            elif self.timer is None and self.max_seconds is not None:
+                # Flush on time even if no more output arrives
+                self.timer = threading.Timer(self.max_seconds, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            entries, self.entries = self.entries, []
+            _dispatch_leveled(entries)
+
+@contextlib.contextmanager
+def display_batch(max_items: int = 500, max_seconds: Optional[float] = 0.5):
+    """Collect output from display_* calls and write it in one flush on exit.
+
+    The buffer is also flushed early once it holds max_items entries or its
+    oldest entry is max_seconds old, and by flush_output(). Each entry keeps
+    its level, so the drop-debug policy of the async writer still applies.
+    Works as a decorator too: @display_batch(). Nested batches join the
+    outer one.
+    """
+    if getattr(_local, "batch", None) is not None:
+        yield _local.batch
         return
+    batch = _OutputBatch(max_items, max_seconds)
+    _local.batch = batch
+    try:
+        yield batch
+    finally:
+        _local.batch = None
+        batch.flush()
+
+# ============================================================================
+# PLAIN TEXT OUTPUT
+# ============================================================================
+
+_plain_mode = None
+
+def set_plain_output(enabled: Optional[bool] = None):
+    """Force the plain-text renderer on or off; None switches it on for non-interactive output"""
+    global _plain_mode
+    _plain_mode = enabled
+
+def _use_plain() -> bool:
+    if _plain_mode is not None:
+        return _plain_mode
+    return not console.is_terminal and not console.is_jupyter
+
+def _write_plain(entries: List[tuple]):
+    """Write entries as plain text, skipping rich layout and ANSI rendering"""
+    file = console.file
+    file.write("".join(_plain_line(objects, kwargs) for objects, kwargs in entries))
+    file.flush()
+
+def _plain_line(objects: tuple, kwargs: Dict[str, Any]) -> str:
+    """Plain text of one print() call, keeping markup in strings printed with markup=False"""
+    markup = kwargs.get("markup") is not False
+    text = kwargs.get("sep", " ").join(_plain(obj) if markup or not isinstance(obj, str) else obj for obj in objects)
+    return text + kwargs.get("end", "\n")
+
+def _plain(obj: Any) -> str:
+    """Plain-text form of anything the display helpers print"""
+    if isinstance(obj, str):
+        return Text.from_markup(obj).plain if "[" in obj else obj
+    if isinstance(obj, Text):
+        return obj.plain
+    renderer = _PLAIN_RENDERERS.get((type(obj).__module__, type(obj).__name__))
+    if renderer is not None:
+        return renderer(obj)
+    if not hasattr(obj, "__rich_console__") and not hasattr(obj, "__rich__"):
+        return str(obj)
+    # Unknown renderable: let rich lay it out, without styles
+    return "".join(segment.text for segment in console.render(obj) if not segment.control).rstrip("\n")
+
+def _indent(text: str, prefix: str = "  ") -> str:
+    return "\n".join(prefix + line for line in text.splitlines())
+
+def _plain_panel(panel) -> str:
+    body = _plain(panel.renderable)
+    if not panel.title:
+        return body
+    return f"{_plain(panel.title)}\n{_indent(body)}"
+
+def _plain_rule(rule) -> str:
+    title = _plain(rule.title)
+    return f" {title} ".center(console.width, "-") if title else "-" * console.width
+
+def _plain_table(table) -> str:
+    header = table.show_header
+    columns = [[_plain(column.header)] * header + [_plain(cell) for cell in column.cells] for column in table.columns]
+    widths = [max((cell_len(cell) for cell in column), default=0) for column in columns]
+    lines = [_plain(table.title)] if table.title else []
+    for index, row in enumerate(zip(*columns)):
+        lines.append("  ".join(cell + " " * (width - cell_len(cell)) for cell, width in zip(row, widths)).rstrip())
+        if index == 0 and header:
+            lines.append("  ".join("-" * width for width in widths))
+    if table.caption:
+        lines.append(_plain(table.caption))
+    return "\n".join(lines)
+
+def _plain_tree(tree) -> str:
+    lines = [_plain(tree.label)]
+    for child in tree.children:
+        lines.append(_indent(_plain_tree(child)))
+    return "\n".join(lines)
+
+_PLAIN_RENDERERS = {
+    ("rich.panel", "Panel"): _plain_panel,
+    ("rich.rule", "Rule"): _plain_rule,
+    ("rich.table", "Table"): _plain_table,
+    ("rich.tree", "Tree"): _plain_tree,
+    ("rich.columns", "Columns"): lambda columns: "\n".join(_plain(item) for item in columns.renderables),
+    ("rich.json", "JSON"): lambda json_renderable: json_renderable.text.plain,
+    ("rich.syntax", "Syntax"): lambda syntax: syntax.code.rstrip("\n"),
+    ("rich.markdown", "Markdown"): lambda markdown: markdown.markup.rstrip("\n"),
+}
+
+# ============================================================================
+# OUTPUT SINKS
+# ============================================================================
+
+class FileSink:
+    """Plain-text log file that rotates to path.1 ... path.N once it reaches max_bytes"""
+
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 3):
+        self.path = os.fspath(path)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.file = open(self.path, "a", encoding="utf-8")
+        self.size = self.file.tell()
+
+    def write(self, segments: list, plain: str):
+        size = len(plain.encode("utf-8"))
+        if self.max_bytes and self.size + size > self.max_bytes and self.size:
+            self._rotate()
+        self.file.write(plain)
+        self.file.flush()
+        self.size += size
+
+    def _rotate(self):
+        self.file.close()
+        for index in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{index + 1}")
+        if self.backup_count:
+            os.replace(self.path, f"{self.path}.1")
+        self.file = open(self.path, "w", encoding="utf-8")
+        self.size = 0
+
+    def close(self):
+        self.file.close()
+
+class RingBufferSink:
+    """Keeps the last maxlen entries in memory as raw (timestamp, segments) records"""
+
+    def __init__(self, maxlen: int = 1000):
+        self.records = deque(maxlen=maxlen)
+
+    def write(self, segments: list, plain: str):
+        self.records.append((time.time(), segments))
+
+    def lines(self) -> List[str]:
+        """Plain text of each buffered entry"""
+        return ["".join(segment.text for segment in segments if not segment.control).rstrip("\n")
+                for _, segments in self.records]
+
+    def close(self):
+        pass
+
+_sinks = []
+_sinks_lock = threading.Lock()
+
+def add_sink(sink: Any):
+    """Send display output to sink as well as the terminal.
+
+    Each entry is laid out once into segments; the terminal gets them as ANSI,
+    FileSink as plain text and RingBufferSink as raw segments. Any object with
+    write(segments, plain) and close() methods works as a sink.
+    """
+    global _sinks
+    with _sinks_lock:
+        _sinks = _sinks + [sink]
+
+def remove_sink(sink: Any):
+    """Stop sending output to sink and close it"""
+    global _sinks
+    with _sinks_lock:
+        _sinks = [existing for existing in _sinks if existing is not sink]
+    sink.close()
+
+def _render_segments(objects: tuple, kwargs: Dict[str, Any]) -> list:
+    """Lay out one print() call into segments, as console.print would with the same kwargs"""
+    from rich.segment import Segment
+    if _use_plain():
+        return [Segment(_plain_line(objects, kwargs))]
+    from rich.protocol import is_renderable
+    markup, emoji, highlight = kwargs.get("markup"), kwargs.get("emoji"), kwargs.get("highlight")
+    justify, overflow = kwargs.get("justify"), kwargs.get("overflow")
+    renderables = [
+        console.render_str(obj, markup=markup, emoji=emoji, highlight=highlight, justify=justify, overflow=overflow)
+        if isinstance(obj, str)
+        else obj if is_renderable(obj)
+        else console.render_str(str(obj), markup=False, emoji=emoji, highlight=highlight, justify=justify,
+                                overflow=overflow)
+        for obj in objects
+    ]
+    if all(isinstance(renderable, Text) for renderable in renderables):
+        line = Text(kwargs.get("sep", " ")).join(renderables)
+        line.end = kwargs.get("end", "\n")
+        line.justify, line.overflow = justify, overflow
+        renderables = [line]
+    options = console.options.update(justify=justify, overflow=overflow, no_wrap=kwargs.get("no_wrap"),
+                                     markup=markup, highlight=highlight)
+    if kwargs.get("width") is not None:
+        options = options.update(width=min(kwargs["width"], console.width))
+    segments = [segment for renderable in renderables for segment in console.render(renderable, options)]
+    style = kwargs.get("style")
+    return list(Segment.apply_style(segments, console.get_style(style))) if style else segments
+
+def _write_to_sinks(entries: List[tuple]):
+    """Render entries once, then encode them per destination"""
+    from rich.segment import Segments
+    segments = [segment for objects, kwargs in entries for segment in _render_segments(objects, kwargs)]
+    plain = "".join(segment.text for segment in segments if not segment.control)
+    # Through the console, so its lock and any Live display or status spinner see the write
+    console.print(Segments(segments), end="")
+    with _sinks_lock:
+        for sink in _sinks:
+            sink.write(segments, plain)
+
+def _close_sinks():
+    for sink in list(_sinks):
+        remove_sink(sink)
+
+atexit.register(_close_sinks)
+
+# ============================================================================
+# BACKGROUND WRITER
+# ============================================================================
+
+_OVERFLOW_POLICIES = ("block", "drop-oldest", "drop-debug")
+
+class _BackgroundWriter:
+    """Bounded queue of pending output drained by a dedicated writer thread"""
+
+    def __init__(self, max_queue: int, overflow: str):
+        self.queue = queue.Queue(max_queue)
+        self.overflow = overflow
+        self.dropped = 0
+        self.reported = 0
+        self.lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name="ultimate_rprint-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, entries: List[tuple], level: str):
+        item = (entries, level)
+        if self.overflow == "block":
+            self.queue.put(item)
+            return
+        try:
+            self.queue.put_nowait(item)
+            return
+        except queue.Full:
+            pass
+        if self.overflow == "drop-debug":
+            if level == "debug":
+                self._drop()
+            else:
+                self.queue.put(item)
+            return
+        # drop-oldest: discard queued output until the new entry fits
+        while True:
+            try:
+                self.queue.get_nowait()
+                self.queue.task_done()
+                self._drop()
+            except queue.Empty:
+                pass
+            try:
+                self.queue.put_nowait(item)
+                return
+            except queue.Full:
+                continue
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            try:
+                if item is None:
+                    return
+                entries, _ = item
+                _write(entries)
+                if self.queue.empty():
+                    with self.lock:
+                        dropped, self.reported = self.dropped - self.reported, self.dropped
+                    if dropped:
+                        _write([((_styled_text(f"... {dropped} messages dropped (output queue full)", "dim"),), {})])
+            except Exception:
+                # A failing render or sink must not kill the writer and leave producers
+                # blocked; report it as the synchronous path would have raised it
+                sys.stderr.write(f"ultimate_rprint: could not write output:\n{traceback.format_exc()}")
+            finally:
+                self.queue.task_done()
+
+    def _drop(self):
+        with self.lock:
+            self.dropped += 1
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+_writer = None
+_writer_lock = threading.Lock()
+
+def enable_async_output(max_queue: int = 10000, overflow: str = "block"):
+    """Write display output from a background thread so callers never wait on the terminal.
+
+    overflow decides what happens when the queue is full: "block" waits for
+    space, "drop-oldest" discards the oldest pending output and "drop-debug"
+    discards new debug messages (other output waits). Pending output is
+    always flushed at interpreter exit.
+    """
+    global _writer
+    if overflow not in _OVERFLOW_POLICIES:
+        raise ValueError(f"overflow must be one of {_OVERFLOW_POLICIES}, got {overflow!r}")
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+        _writer = _BackgroundWriter(max_queue, overflow)
+
+def disable_async_output():
+    """Flush pending output and return to writing synchronously"""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.close()
+
+def flush_output():
+    """Flush this thread's active batch and block until all queued output has been written"""
+    batch = getattr(_local, "batch", None)
+    if batch is not None:
+        batch.flush()
+    writer = _writer
+    if writer is not None:
+        writer.queue.join()
+
+atexit.register(disable_async_output)
+
+# ============================================================================
+# COALESCING AND RATE LIMITING
+# ============================================================================
+
+class _Coalescer:
+    """Merges repeated same-key messages per time window and caps lines per second"""
+
+    def __init__(self, window: float, max_lines_per_second: Optional[float]):
+        self.window = window
+        self.max_lines_per_second = max_lines_per_second
+        self.lock = threading.Lock()
+        self.pending = {}  # key -> [window start, repeats, latest Text]
+        self.last_sweep = time.monotonic()
+        # The bucket holds at least one token, so rates below 1/s still let lines through
+        self.burst = None if max_lines_per_second is None else max(1.0, max_lines_per_second)
+        self.tokens = self.burst
+        self.refilled = self.last_sweep
+        self.suppressed = 0
+        self.timer = None
+
+    def submit(self, key: tuple, text: Text):
+        now = time.monotonic()
+        with self.lock:
+            lines = self._sweep(now) if now - self.last_sweep >= self.window else []
+            state = self.pending.get(key)
+            if state is None:
+                self.pending[key] = [now, 0, None]
+                lines.append(text)
+            else:
+                state[1] += 1
+                state[2] = text
+                if now - state[0] >= self.window:
+                    lines.append(self._summary(state, now))
+                    self.pending[key] = [now, 0, None]
+            lines = self._limit(lines, now)
+            self._schedule()
+        for line in lines:
+            _emit(line, level="progress")
+
+    def flush(self):
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            now = time.monotonic()
+            lines = [self._summary(state, now) for state in self.pending.values() if state[1]]
+            self.pending.clear()
+            if self.suppressed:
+                lines.append(self._suppressed_notice())
+        for line in lines:
+            _emit(line, level="progress")
+
+    def _schedule(self):
+        """Start the timer that closes windows and reports suppressed lines if nothing else arrives"""
+        if self.timer is None and (self.suppressed or any(state[1] for state in self.pending.values())):
+            self.timer = threading.Timer(self.window, self._on_timer)
+            self.timer.daemon = True
+            self.timer.start()
+
+    def _on_timer(self):
+        with self.lock:
+            self.timer = None
+            now = time.monotonic()
+            lines = self._limit(self._sweep(now), now)
+            if self.suppressed:
+                lines.append(self._suppressed_notice())
+            self._schedule()
+        for line in lines:
+            _emit(line, level="progress")
+
+    def _sweep(self, now: float) -> List[Text]:
+        """Close windows that expired without a new message arriving"""
+        self.last_sweep = now
+        lines = []
+        for key, state in list(self.pending.items()):
+            if now - state[0] >= self.window:
+                if state[1]:
+                    lines.append(self._summary(state, now))
+                del self.pending[key]
+        return lines
+
+    def _summary(self, state: list, now: float) -> Text:
+        text = state[2].copy()
+        text.append(f" (x{state[1]} in {now - state[0]:.1f}s)", style=_style("dim"))
+        return text
+
+    def _limit(self, lines: List[Text], now: float) -> List[Text]:
+        """Token bucket over emitted lines; dropped lines are reported, free of charge,
+        before the next line that gets through (or by the timer)"""
+        if self.max_lines_per_second is None or not lines:
+            return lines
+        self.tokens = min(self.burst, self.tokens + (now - self.refilled) * self.max_lines_per_second)
+        self.refilled = now
+        allowed = []
+        for line in lines:
+            if self.tokens >= 1:
+                if self.suppressed:
+                    allowed.append(self._suppressed_notice())
+                allowed.append(line)
+                self.tokens -= 1
+            else:
+                self.suppressed += 1
+        return allowed
+
+    def _suppressed_notice(self) -> Text:
+        notice = _styled_text(f"... {self.suppressed} status lines suppressed (rate limit)", "dim")
+        self.suppressed = 0
+        return notice
+
+_coalescer = None
+
+def enable_coalescing(window: float = 1.0, max_lines_per_second: Optional[float] = None):
+    """Merge repeated status/progress/search messages and cap how fast they are printed.
+
+    Within each window, repeats of the same display_status_update or
+    display_progress_msg message (and any display_memory_search_start call)
+    collapse into one line such as "Searching: 'x' (x532 in 1.0s)", printed
+    when the window closes. max_lines_per_second allows bursts of up to
+    max(1, max_lines_per_second) lines; suppressed lines are counted in a
+    notice.
+    """
+    global _coalescer
+    disable_coalescing()
+    _coalescer = _Coalescer(window, max_lines_per_second)
+
+def disable_coalescing():
+    """Print pending merged lines and stop coalescing"""
+    global _coalescer
+    coalescer, _coalescer = _coalescer, None
+    if coalescer is not None:
+        coalescer.flush()
+
+def flush_coalesced():
+    """Print merged lines for messages still inside their window"""
+    coalescer = _coalescer
+    if coalescer is not None:
+        coalescer.flush()
+
+atexit.register(flush_coalesced)
+
+# ============================================================================
+# ASYNCIO API
+# ============================================================================
+
+_aio_executor = None
+_prompt_executor = None
+
+def _get_aio_executor():
+    """Single worker thread, so output written from coroutines stays in order"""
+    global _aio_executor
+    if _aio_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _aio_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ultimate_rprint-aio")
+    return _aio_executor
+
+def _get_prompt_executor():
+    """Separate thread for prompts, so output from other coroutines keeps flowing while one waits"""
+    global _prompt_executor
+    if _prompt_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _prompt_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ultimate_rprint-prompt")
+    return _prompt_executor
+
+async def _in_aio_thread(func, *args):
+    """Run a blocking call on the aio worker thread without blocking the event loop"""
+    import asyncio
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_aio_executor(), func, *args)
+
+async def _prompt(func, *args):
+    """Write pending output, then run a prompt on the prompt thread"""
+    import asyncio
+    await _in_aio_thread(flush_output)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_prompt_executor(), func, *args)
+
+def _capture_entries(func, *args, **kwargs) -> List[tuple]:
+    """Run a display helper and return the (objects, kwargs, level) entries it produced instead of writing them"""
+    batch = _OutputBatch(sys.maxsize, None)
+    outer = getattr(_local, "batch", None)
+    _local.batch = batch
+    try:
+        func(*args, **kwargs)
+    finally:
+        _local.batch = outer
+    return batch.entries
+
+# Helpers that only build and print output, safe to run on the event loop and
+# write from the aio worker. Context managers, prompts and helpers that block
+# on I/O have dedicated coroutines or stay synchronous.
+_AIO_HELPERS = frozenset({
+    "display_any", "display_api_error", "display_artifact_list", "display_code", "display_completion_banner",
+    "display_completion_panel", "display_connection_item", "display_debug", "display_decision_output",
+    "display_diff", "display_divider", "display_error", "display_error_panel", "display_execution_summary",
+    "display_fallback_notice", "display_generating_report", "display_header", "display_info", "display_json",
+    "display_json_diff", "display_key_value", "display_list", "display_loading", "display_log",
+    "display_markdown", "display_memory_connections_header", "display_memory_search_start",
+    "display_memory_skipped", "display_memory_storage_prompt", "display_memory_stored", "display_multi_column",
+    "display_no_memories_found", "display_operation_complete", "display_operation_start",
+    "display_pipeline_complete", "display_pipeline_failed", "display_pipeline_init", "display_pipeline_start",
+    "display_preview_text", "display_process_step", "display_progress_bar", "display_progress_msg",
+    "display_replacement", "display_research_complete", "display_search_result",
+    "display_search_term_extracted", "display_section_panel", "display_separator", "display_side_by_side",
+    "display_status_panel", "display_status_update", "display_step_progress", "display_subheader",
+    "display_success", "display_table", "display_test_failure", "display_test_start", "display_test_success",
+    "display_thin_divider", "display_tracker_error", "display_tree", "display_warning",
+    "display_welcome_banner", "print_blue", "print_bold", "print_cyan", "print_dim", "print_green",
+    "print_magenta", "print_red", "print_yellow",
+})
+
+class _AsyncDisplay:
+    """Coroutine versions of the display helpers: await aio.adisplay_info("...")
+
+    The output helpers (see _AIO_HELPERS) are available with an "a" prefix.
+    Output is built on the event loop and written from a worker thread, so a
+    slow terminal never stalls the loop. Prompts run on a thread of their own.
+    """
+
+    def __getattr__(self, name: str):
+        if not name.startswith("a") or name[1:] not in _AIO_HELPERS:
+            raise AttributeError(f"aio has no attribute {name!r}")
+        sync = globals()[name[1:]]
+
+        async def wrapper(*args, **kwargs):
+            entries = _capture_entries(sync, *args, **kwargs)
+            if entries:
+                await _in_aio_thread(_dispatch_leveled, entries)
+
+        functools.update_wrapper(wrapper, sync)
+        wrapper.__name__ = wrapper.__qualname__ = name
+        setattr(self, name, wrapper)
+        return wrapper
+
+    async def aflush_output(self):
+        """Wait until all output written from coroutines has reached the terminal"""
+        await _in_aio_thread(flush_output)
+
+    async def adisplay_countdown(self, seconds: int, message: str = "Waiting"):
+        """Countdown timer that sleeps with asyncio.sleep"""
+        import asyncio
+        for i in range(seconds, 0, -1):
+            await self.adisplay_replacement(f"[yellow]{message}: {i}s[/yellow]", end="\r")
+            await asyncio.sleep(1)
+        await self.adisplay_replacement(f"[green]{message}: Done![/green]")
+
+    @contextlib.asynccontextmanager
+    async def adisplay_spinner(self, message: str):
+        """Async context manager for spinner during operations"""
+        await self.aflush_output()
+        with console.status(f"[cyan]{message}[/cyan]", spinner="dots"):
+            yield
+
+    async def adisplay_ask(self, question: str) -> str:
+        """Ask user a question without blocking the event loop"""
+        return await _prompt(display_ask, question)
+
+    async def adisplay_ask_yes_no(self, question: str) -> bool:
+        """Ask yes/no question without blocking the event loop"""
+        return await _prompt(display_ask_yes_no, question)
+
+    async def adisplay_ask_choice(self, question: str, choices: List[str]) -> str:
+        """Ask user to choose from options without blocking the event loop"""
+        return await _prompt(display_ask_choice, question, choices)
+
+aio = _AsyncDisplay()
+
+# ============================================================================
+# CELL FORMATTERS
+# ============================================================================
+
+def _format_float(value: float) -> str:
+    """Up to 4 decimals without trailing zeros; very small or large magnitudes in scientific notation"""
+    if value == 0 or 1e-4 <= abs(value) < 1e15:
+        text = f"{value:.4f}".rstrip("0")
+        return text + "0" if text.endswith(".") else text
+    return f"{value:.4g}"
+
+def _format_bytes(value: bytes) -> str:
+    """Hex preview of the first 8 bytes and the total size"""
+    preview = bytes(value[:8]).hex() + ("…" if len(value) > 8 else "")
+    return f"0x{preview} ({len(value):,} B)"
+
+def _format_nested(value: Any) -> str:
+    """Short containers as their repr, others summarised by size (dicts also by their first keys)"""
+    items = value.values() if isinstance(value, Mapping) else value
+    if len(value) <= 5 and not any(isinstance(item, (dict, list, tuple, set)) for item in items):
+        text = repr(value)
+        if len(text) <= 40:
+            return text
+    if isinstance(value, Mapping):
+        keys = ", ".join(str(key) for key in itertools.islice(value, 3))
+        return f"{{{keys}, … {len(value):,} keys}}"
+    return f"[{len(value):,} items]"
+
+# Formatters by type (matched along the MRO, so subclasses inherit them) or by
+# kind as the fallback. Each takes a non-null value and returns the cell text.
+_FORMATTERS = {
+    bool: str,
+    int: str,
+    float: _format_float,
+    datetime.datetime: lambda value: value.isoformat(sep=" ", timespec="seconds"),
+    datetime.date: datetime.date.isoformat,
+    datetime.time: lambda value: value.isoformat(timespec="seconds"),
+    "number": str,
+    "str": str,
+    "datetime": str,
+    "bytes": _format_bytes,
+    "nested": _format_nested,
+    "other": str,
+}
+_DEFAULT_FORMATTERS = dict(_FORMATTERS)
+
+def _as_formatter(formatter: Union[str, Callable[[Any], str]]) -> Callable[[Any], str]:
+    """A formatter function; a string is a format spec (e.g. ".2f"), falling back to str where it does not apply"""
+    if callable(formatter):
+        return formatter
+    
+    def format_spec(value):
+        try:
+            return format(value, formatter)
+        except (TypeError, ValueError):
+            return str(value)
+    return format_spec
+
+def set_formatter(key: Union[str, type], formatter: Union[None, str, Callable[[Any], str]]):
+    """Set how table cells of a type or kind ("number", "datetime", "bytes", "nested", ...) are shown.
+
+    formatter is a function of the value or a format spec such as ".2f";
+    None restores the built-in formatter for key.
+    """
+    if formatter is None:
+        if key in _DEFAULT_FORMATTERS:
+            _FORMATTERS[key] = _DEFAULT_FORMATTERS[key]
+        else:
+            _FORMATTERS.pop(key, None)
+    else:
+        _FORMATTERS[key] = _as_formatter(formatter)
+    _type_formatter.cache_clear()
+
+@functools.lru_cache(maxsize=None)
+def _type_formatter(cls: type) -> Callable[[Any], str]:
+    for base in cls.__mro__:
+        if base in _FORMATTERS:
+            return _FORMATTERS[base]
+    return _FORMATTERS.get(_type_kind(cls), str)
+
+def _format_any(value: Any) -> str:
+    """Format one value by its own type, for columns that mix types"""
+    return _type_formatter(type(value))(value)
+
+def _column_formatters(schema: "_Schema", columns: List[Any],
+                       formatters: Optional[Dict[Any, Any]] = None) -> List[Callable[[Any], str]]:
+    """One formatter per column, resolved once: the column's entry in formatters, else the formatter
+    for its single value type, else per-value dispatch"""
+    resolved = []
+    for key in columns:
+        if formatters and key in formatters:
+            resolved.append(_as_formatter(formatters[key]))
+            continue
+        types = schema.types.get(key, ())
+        resolved.append(_type_formatter(next(iter(types))) if len(types) == 1 else _format_any)
+    return resolved
+
+def _format_cells(rows: List[Dict], columns: List[Any], formats: List[Callable[[Any], str]]) -> List[tuple]:
+    """Cell texts for rows; missing and None values are empty.
+
+    Works column by column so columns without nulls are formatted with a
+    single C-level map() call.
+    """
+    if not columns:
+        return [() for _ in rows]
+    texts = []
+    for key, fmt in zip(columns, formats):
+        values = [row.get(key) for row in rows]
+        # Identity checks: == on array-valued cells would raise
+        if any(value is None for value in values):
+            texts.append(["" if value is None else fmt(value) for value in values])
+        else:
+            texts.append(list(map(fmt, values)))
+    return list(zip(*texts))
+
+# ============================================================================
+# TABLE INTERNALS
+# ============================================================================
+
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _type_kind(cls: type) -> str:
+    """Coarse kind of a cell value type, used to pick alignment and formatting per column"""
+    if issubclass(cls, bool):
+        return "bool"
+    if issubclass(cls, numbers.Number):
+        return "number"
+    if issubclass(cls, str):
+        return "str"
+    if issubclass(cls, (datetime.date, datetime.time)):
+        return "datetime"
+    if issubclass(cls, (bytes, bytearray)):
+        return "bytes"
+    if issubclass(cls, (dict, list, tuple, set)):
+        return "nested"
+    return "other"
+
+def _value_kind(value: Any) -> str:
+    """Coarse kind of a cell value ("bool", "number", "str", "datetime", "bytes", "nested", "other")"""
+    return _type_kind(type(value))
+
+class _Schema:
+    """Union of the columns seen across rows, in first-seen order, with their value types"""
+
+    def __init__(self):
+        self.types = {}  # column -> set of types of its non-null values
+
+    def add(self, row: Dict):
+        for key, value in row.items():
+            types = self.types.get(key)
+            if types is None:
+                types = self.types[key] = set()
+            if value is not None:
+                types.add(type(value))
+
+    @property
+    def columns(self) -> List[Any]:
+        return list(self.types)
+
+    def kind(self, column: Any) -> str:
+        """The column's kind, "mixed" for several kinds and "empty" if only nulls were seen"""
+        kinds = {_type_kind(cls) for cls in self.types.get(column, ())}
+        if not kinds:
+            return "empty"
+        return next(iter(kinds)) if len(kinds) == 1 else "mixed"
+
+def _no_rows(data: Any) -> bool:
+    """True for None, empty sequences or mappings and non-iterables, shown as "No data" rather than raising"""
+    if data is None:
+        return True
+    if isinstance(data, (Sequence, Mapping)):
+        return len(data) == 0
+    return not hasattr(data, "__iter__") and _columnar_rows(data, 0) is None
+
+def _take_rows(data: Iterable[Dict], max_rows: int, count_rows: bool = True, schema_sample: int = 1000):
+    """First max_rows rows of data, the total row count and the inferred schema.
+
+    Runs in constant memory. Sized sequences report len(data). Other iterables
+    are consumed: the rest is counted without being stored, or when count_rows
+    is False only one more row is read and the total is None if more rows
+    exist. Columns are the union of keys over the shown rows and every
+    further row read from an iterator; for sequences, schema_sample further
+    rows evenly spaced up to the last one stand in for the rest.
+    """
+    schema = _Schema()
+    columnar = _columnar_rows(data, max_rows)
+    if columnar is not None:
+        rows, total = columnar
+        for row in rows:
+            schema.add(row)
+        return rows, total, schema
+    if isinstance(data, Sequence):
+        rows = list(itertools.islice(data, max_rows))
+        total = len(data)
+        step = max(1, -(-(total - len(rows)) // max(schema_sample, 1)))
+        sample = [data[i] for i in range(len(rows), total, step)]
+        if total > len(rows):
+            sample.append(data[total - 1])
+        for row in itertools.chain(rows, sample):
+            schema.add(row)
+        return rows, total, schema
+    iterator = iter(data)
+    rows = list(itertools.islice(iterator, max_rows))
+    for row in rows:
+        schema.add(row)
+    if not count_rows:
+        more = next(iterator, _MISSING)
+        if more is _MISSING:
+            return rows, len(rows), schema
+        schema.add(more)
+        return rows, None, schema
+    # The rest is walked to count it anyway, so only rows with unseen keys
+    # are added to the schema
+    known = set(schema.types)
+    counter = itertools.count()
+    for row in itertools.filterfalse(known.issuperset, map(operator.itemgetter(0), zip(iterator, counter))):
+        schema.add(row)
+        known.update(row)
+    # zip stops before advancing the counter, so next(counter) is the row count
+    return rows, len(rows) + next(counter), schema
+
+def _columnar_rows(data: Any, max_rows: int, start: int = 0):
+    """Rows and total for column-oriented data, slicing only the rows shown.
+
+    Handles dict of lists, NumPy structured arrays, pandas DataFrames and
+    pyarrow Tables/RecordBatches. Returns None for anything else. The optional
+    libraries are recognised by module name, so none of them is imported here.
+    """
+    stop = start + max_rows
+    if isinstance(data, Mapping):
+        lengths = {key: len(values) for key, values in data.items()}
+        total = max(lengths.values(), default=0)
+        shown = range(min(start, total), min(stop, total))
+        # Ragged columns: cells past the end of a shorter column are None
+        return [{key: values[i] if i < lengths[key] else None for key, values in data.items()} for i in shown], total
+    library = type(data).__module__.split(".")[0]
+    if library == "numpy" and getattr(getattr(data, "dtype", None), "names", None):
+        names = data.dtype.names
+        return [dict(zip(names, record)) for record in data[start:stop].tolist()], len(data)
+    if library == "pandas" and hasattr(data, "iloc") and hasattr(data, "columns"):
+        # NaN, NaT and NA become None, as pyarrow nulls do
+        frame = data.iloc[start:stop]
+        return frame.astype(object).where(frame.notna(), None).to_dict("records"), len(data)
+    if library == "pyarrow" and hasattr(data, "num_rows"):
+        return data.slice(min(start, data.num_rows), max_rows).to_pylist(), data.num_rows
+    return None
+
+class _PagedRows:
+    """Random access to pages of rows, fetched lazily from a sequence, columnar data or an iterator"""
+
+    def __init__(self, data: Any, cache_rows: int = 1000):
+        self.data = data
+        self.columnar = _columnar_rows(data, 0) is not None
+        self.iterator = None
+        if self.columnar:
+            self.total = _columnar_rows(data, 0)[1]
+        elif isinstance(data, Sequence):
+            self.total = len(data)
+        else:
+            # Iterators are read only as far as the furthest page requested, keeping
+            # the last cache_rows rows; iterables that are not iterators are re-read
+            # from the start to go back further
+            self.iterator = iter(data)
+            self.restartable = self.iterator is not data
+            self.cache = deque(maxlen=cache_rows)
+            self.read = 0
+            self.total = None
+
+    @property
+    def known_rows(self) -> int:
+        return self.total if self.total is not None else self.read
+
+    def page(self, start: int, size: int) -> tuple:
+        """(start, rows) of the page at start; start moves forward if an iterator cannot go back that far"""
+        if self.columnar:
+            return start, _columnar_rows(self.data, size, start)[0]
+        if self.iterator is None:
+            return start, [self.data[i] for i in range(start, min(start + size, self.total))]
+        if start < self.read - len(self.cache):
+            if self.restartable:
+                self.iterator = iter(self.data)
+                self.cache.clear()
+                self.read = 0
+            else:
+                start = self.read - len(self.cache)
+        missing = start + size - self.read
+        while missing > 0 and self.total is None:
+            requested = min(missing, self.cache.maxlen)
+            fetched = list(itertools.islice(self.iterator, requested))
+            self.cache.extend(fetched)
+            self.read += len(fetched)
+            missing -= len(fetched)
+            if len(fetched) < requested:
+                self.total = self.read
+        first = start - (self.read - len(self.cache))
+        return start, list(itertools.islice(self.cache, max(first, 0), max(first + size, 0)))
+
+def _iter_rows(data: Any, chunk: int = 1000) -> Iterable[Dict]:
+    """Rows of data one at a time; columnar data is converted chunk rows at a time"""
+    start = 0
+    while True:
+        rows = _columnar_rows(data, chunk, start)[0]
+        yield from rows
+        if len(rows) < chunk:
+            return
+        start += chunk
+
+def _is_missing(value: Any) -> bool:
+    """Whether value is None or unequal to itself, as float NaN and pandas NaT are"""
+    if value is None:
+        return True
+    try:
+        return bool(value != value)
+    except (TypeError, ValueError):
+        return False
+
+class _Extreme:
+    """Compares above (or below) every other value, standing in for a missing sort key"""
+
+    def __init__(self, high: bool):
+        self.high = high
+
+    def __lt__(self, other):
+        return other is not self and not self.high
+
+    def __gt__(self, other):
+        return other is not self and self.high
+
+def _top_rows(data: Any, sort_by: Union[str, Callable[[Dict], Any]], k: int, descending: bool):
+    """The first k rows of data ordered by sort_by, and the number of rows read.
+
+    Uses heapq.nsmallest/nlargest, so only k rows are held in memory and the
+    cost is O(n log k) instead of a full sort. Ties keep their input order and
+    rows without a value for the sort key (None, NaN or NaT) come last in
+    either direction.
+    """
+    last = _Extreme(high=not descending)
+    if callable(sort_by):
+        def key(row):
+            value = sort_by(row)
+            return last if _is_missing(value) else value
+    else:
+        def key(row):
+            value = row.get(sort_by)
+            return last if _is_missing(value) else value
     
+    select = heapq.nlargest if descending else heapq.nsmallest
+    columnar = _columnar_rows(data, 0)
+    if columnar is not None:
+        return select(k, _iter_rows(data), key=key), columnar[1]
+    if isinstance(data, Sequence):
+        return select(k, data, key=key), len(data)
+    counter = itertools.count()
+    # zip stops before advancing the counter, so next(counter) is the row count
+    rows = select(k, map(operator.itemgetter(0), zip(data, counter)), key=key)
+    return rows, next(counter)
+
+_CONTROL_CHARS = re.compile(r"[\x00-\x1f\x7f]")
+
+def _single_line(text: str) -> str:
+    """text as one line of cells: tabs expanded, line breaks shown as ↵, other control characters dropped"""
+    if text.isprintable():
+        return text
+    text = text.expandtabs(4).replace("\r\n", "↵").replace("\n", "↵").replace("\r", "↵")
+    return _CONTROL_CHARS.sub("", text)
+
+def _truncate(text: str, width: int) -> str:
+    """Cut text to width terminal cells with an ellipsis; ASCII text skips cell measurement"""
+    if width <= 1:
+        return text if cell_len(text) <= width else "…"[:max(width, 0)]
+    if text.isascii():
+        return text if len(text) <= width else text[:width - 1] + "…"
+    from rich.cells import set_cell_size
+    return text if cell_len(text) <= width else set_cell_size(text, width - 1).rstrip() + "…"
+
+def _sample_widths(labels: List[str], cells: List[List[str]]) -> List[int]:
+    """Width of each column's header and sampled cell texts, capped at 50"""
+    return [
+        min(50, max([cell_len(label)] + [cell_len(row[index]) for row in cells]))
+        for index, label in enumerate(labels)
+    ]
+
+def _column_widths(widths: Any, columns: List[Any], auto: List[int]) -> List[int]:
+    """Resolve the widths argument of display_table to one width per column.
+
+    An int applies to every column, a list gives widths in column order and a
+    dict gives widths by column key. "auto" and any column the argument leaves
+    out use the sampled widths in auto.
+    """
+    if isinstance(widths, int):
+        return [widths] * len(columns)
+    if isinstance(widths, Mapping):
+        return [widths.get(key, width) for key, width in zip(columns, auto)]
+    if widths == "auto":
+        return list(auto)
+    return list(widths)[:len(columns)] + auto[len(widths):]
+
+def _build_table(title: str, rows: List[Dict], schema: "_Schema", widths: Any = None,
+                 formatters: Optional[Dict[Any, Any]] = None, styles: Optional[List[Optional[str]]] = None):
+    """Rich Table for rows, with columns taken from schema.
+
+    Cells are formatted by type (see set_formatter) or by the formatters given
+    per column, each resolved once per column. With widths set, columns get a
+    fixed width so rich skips measuring every cell, and cells are
+    pre-truncated and added as Text (no markup parsing). "auto" widths are
+    sized from the header and the first 20 rows. Rows with a style in styles
+    (e.g. subtotals) are set apart by section lines.
+    """
+    from rich.box import ROUNDED
+    from rich.table import Table
     table = Table(title=f"[bold blue]{title}[/bold blue]", box=ROUNDED)
     
-    # Auto-detect columns
-    first_row = data[0]
-    for key in first_row.keys():
-        table.add_column(key.replace('_', ' ').title(), style="cyan")
+    # Columns are the union of keys across rows, numbers right-aligned
+    columns = schema.columns
+    labels = [str(key).replace('_', ' ').title() for key in columns]
+    cells = _format_cells(rows, columns, _column_formatters(schema, columns, formatters))
+    fixed = None
+    if widths is not None:
+        fixed = _column_widths(widths, columns, _sample_widths(labels, cells[:20]))
+    for index, key in enumerate(columns):
+        justify = "right" if schema.kind(key) == "number" else "left"
+        if fixed is None:
+            table.add_column(labels[index], style="cyan", justify=justify)
+        else:
+            table.add_column(labels[index], style="cyan", justify=justify,
+                             width=fixed[index], no_wrap=True, overflow="ellipsis")
     
     # Add data rows
-    for row in data[:max_rows]:
-        values = [str(row.get(key, ""))[:50] for key in first_row.keys()]
-        table.add_row(*values)
+    styles = styles or [None] * len(cells)
+    for index, row in enumerate(cells):
+        following = styles[index + 1] if index + 1 < len(styles) else None
+        end_section = styles[index] is not None or following is not None
+        if fixed is None:
+            table.add_row(*[text[:50] for text in row], style=styles[index], end_section=end_section)
+        else:
+            table.add_row(*[Text(_truncate(text, width)) for text, width in zip(row, fixed)],
+                          style=styles[index], end_section=end_section)
+    return table
+
+_MASK64 = (1 << 64) - 1
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer, spreading Python hashes (identity for small ints) over 64 bits"""
+    value &= _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+class _DistinctSketch:
+    """K-minimum-values distinct count: exact up to k values, an estimate (~3% error) above.
+
+    Up to k values are kept themselves, since different values can share a
+    hash (hash(-1) == hash(-2)); the hashes only feed the estimate.
+    """
+
+    def __init__(self, k: int = 1024):
+        self.k = k
+        self.exact = set()  # None once more than k distinct values were seen
+        self.heap = []  # negated hashes, so heap[0] is the largest kept hash
+        self.members = set()
+
+    def add(self, value: Any):
+        try:
+            hashed = _mix64(hash(value))
+        except TypeError:
+            value = repr(value)
+            hashed = _mix64(hash(value))
+        if self.exact is not None:
+            self.exact.add(value)
+            if len(self.exact) > self.k:
+                self.exact = None
+        if hashed in self.members:
+            return
+        if len(self.members) < self.k:
+            self.members.add(hashed)
+            heapq.heappush(self.heap, -hashed)
+        elif hashed < -self.heap[0]:
+            self.members.discard(-heapq.heapreplace(self.heap, -hashed))
+            self.members.add(hashed)
+
+    def estimate(self) -> Union[int, str]:
+        if self.exact is not None:
+            return len(self.exact)
+        if len(self.members) < self.k:
+            return f"~{len(self.members):,}"
+        return f"~{int((self.k - 1) * (_MASK64 + 1) / -self.heap[0]):,}"
+
+def _stat(value: Any) -> Any:
+    """Summary cell value: NumPy scalars unwrapped, floats cut to 6 significant digits"""
+    if hasattr(value, "item"):
+        value = value.item()
+    if isinstance(value, float):
+        return float(f"{value:.6g}")
+    return value
+
+def _top_values(pairs: Iterable, limit: int = 3) -> str:
+    """The most frequent (value, count) pairs, empty when no value repeats"""
+    top = [(value, count) for value, count in heapq.nlargest(limit, pairs, key=lambda pair: pair[1]) if count > 1]
+    return ", ".join(f"{_truncate(str(value), 20)} ({count:,})" for value, count in top)
+
+class _ColumnStats:
+    """Single-pass statistics for one column.
+
+    Mean and standard deviation use Welford's update, distinct values a KMV
+    sketch and top values a counter pruned back to its 64 largest entries
+    whenever it reaches 256, so memory stays bounded for any number of rows.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.kinds = set()
+        self.numeric = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = self.max = None
+        self.ordered = True
+        self.distinct = _DistinctSketch()
+        self.counts = {}
+
+    def add(self, value: Any):
+        if _is_missing(value):
+            return
+        self.count += 1
+        kind = _value_kind(value)
+        self.kinds.add(kind)
+        if kind == "number" and isinstance(value, numbers.Real):
+            self.numeric += 1
+            delta = value - self.mean
+            self.mean += delta / self.numeric
+            self.m2 += delta * (value - self.mean)
+        if self.ordered and kind != "nested":
+            try:
+                if self.min is None or value < self.min:
+                    self.min = value
+                if self.max is None or value > self.max:
+                    self.max = value
+            except TypeError:
+                self.ordered = False
+                self.min = self.max = None
+        self.distinct.add(value)
+        key = value if kind != "nested" else repr(value)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if len(self.counts) >= 256:
+            self.counts = dict(heapq.nlargest(64, self.counts.items(), key=lambda pair: pair[1]))
+
+    def row(self, column: Any, total: int) -> Dict:
+        numeric = self.numeric and self.numeric == self.count
+        kind = "empty" if not self.kinds else next(iter(self.kinds)) if len(self.kinds) == 1 else "mixed"
+        return {
+            "column": str(column), "type": kind, "count": self.count, "nulls": total - self.count,
+            "min": _stat(self.min), "max": _stat(self.max),
+            "mean": _stat(self.mean) if numeric else None,
+            "std": _stat((self.m2 / (self.numeric - 1)) ** 0.5) if numeric and self.numeric > 1 else None,
+            "distinct": self.distinct.estimate(), "top_values": _top_values(self.counts.items()),
+        }
+
+def _numpy_column_stats(column: Any, values: Any) -> Optional[Dict]:
+    """Vectorized statistics for a numeric column, or None when NumPy is missing or the column is not numeric"""
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    array = np.asarray(values)
+    if array.ndim != 1 or array.dtype.kind not in "iuf":
+        return None
+    valid = array[~np.isnan(array)] if array.dtype.kind == "f" else array
+    uniques, counts = np.unique(valid, return_counts=True)
+    empty = valid.size == 0
+    return {
+        "column": str(column), "type": "empty" if empty else "number",
+        "count": int(valid.size), "nulls": int(array.size - valid.size),
+        "min": None if empty else _stat(valid.min()), "max": None if empty else _stat(valid.max()),
+        "mean": None if empty else _stat(valid.mean()),
+        "std": _stat(valid.std(ddof=1)) if valid.size > 1 else None,
+        "distinct": int(uniques.size), "top_values": _top_values(zip(uniques.tolist(), counts.tolist())),
+    }
+
+def _columns_of(data: Any) -> Optional[Dict[Any, Any]]:
+    """Column name -> column values for column-oriented data, or None for row data"""
+    if isinstance(data, Mapping):
+        return dict(data)
+    library = type(data).__module__.split(".")[0]
+    if library == "numpy" and getattr(getattr(data, "dtype", None), "names", None):
+        return {name: data[name] for name in data.dtype.names}
+    if library == "pandas" and hasattr(data, "iloc") and hasattr(data, "columns"):
+        return {name: data[name].to_numpy() for name in data.columns}
+    if library == "pyarrow" and hasattr(data, "num_rows"):
+        return {name: _arrow_to_numpy(data.column(name)) for name in data.schema.names}
+    return None
+
+def _arrow_to_numpy(column: Any) -> Any:
+    """NumPy view of a pyarrow Array or ChunkedArray, copying when nulls or strings require it"""
+    try:
+        return column.to_numpy(zero_copy_only=False)
+    except TypeError:  # ChunkedArray.to_numpy() on older pyarrow takes no arguments
+        return column.to_numpy()
+
+def _summarize(data: Any):
+    """Per-column summary rows and the row count, from one pass over data.
+
+    Numeric columns of columnar data are summarised with NumPy when it is
+    installed; everything else streams through _ColumnStats, so iterators of
+    any length are summarised in memory bounded by the number of columns.
+    """
+    columns = _columns_of(data)
+    if columns is not None:
+        rows = []
+        total = max((len(values) for values in columns.values()), default=0)
+        for name, values in columns.items():
+            row = _numpy_column_stats(name, values)
+            if row is None:
+                stats = _ColumnStats()
+                for value in values:
+                    stats.add(value)
+                row = stats.row(name, total)
+            rows.append(row)
+        return rows, total
+    stats = {}
+    total = 0
+    for row in data:
+        total += 1
+        for key, value in row.items():
+            column = stats.get(key)
+            if column is None:
+                column = stats[key] = _ColumnStats()
+            column.add(value)
+    return [column.row(key, total) for key, column in stats.items()], total
+
+def _min_state(state: Any, value: Any) -> Any:
+    return value if state is None or value < state else state
+
+def _max_state(state: Any, value: Any) -> Any:
+    return value if state is None or value > state else state
+
+def _merge_extreme(pick: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    return lambda first, second: first if second is None else pick(first, second)
+
+# A mergeable aggregation: initial state, state + non-null value, state + state, final value
+_Aggregate = namedtuple("_Aggregate", "init update merge result")
+
+_AGGREGATES = {
+    "count": _Aggregate(lambda: 0, lambda state, value: state + 1, operator.add, lambda state: state),
+    "sum": _Aggregate(lambda: 0, operator.add, operator.add, lambda state: state),
+    "mean": _Aggregate(lambda: (0, 0), lambda state, value: (state[0] + value, state[1] + 1),
+                       lambda first, second: (first[0] + second[0], first[1] + second[1]),
+                       lambda state: state[0] / state[1] if state[1] else None),
+    "min": _Aggregate(lambda: None, _min_state, _merge_extreme(_min_state), lambda state: state),
+    "max": _Aggregate(lambda: None, _max_state, _merge_extreme(_max_state), lambda state: state),
+}
+
+def _aggregate_specs(aggregate: Optional[Dict[str, Any]]) -> List[tuple]:
+    """(output column, input column or None for rows, aggregation name) for each aggregate entry"""
+    if not aggregate:
+        return [("count", None, "count")]
+    specs = []
+    for name, spec in aggregate.items():
+        column, func = spec if isinstance(spec, tuple) else (None if spec == "count" else name, spec)
+        if func not in _AGGREGATES:
+            raise ValueError(f"aggregation must be one of {tuple(_AGGREGATES)}, got {func!r}")
+        specs.append((name, column, func))
+    return specs
+
+def _more_groups(keys: List[str], count: int) -> Dict:
+    return {keys[0]: f"… {_plural(count, 'more group')}"}
+
+def _group_rows(data: Any, group_by: Union[str, List[str]], aggregate: Optional[Dict[str, Any]] = None,
+                subtotals: bool = False, max_groups: Optional[int] = None):
+    """Aggregated rows for each group of data, their styles, the group count and the input row count.
+
+    One pass over the rows updates a dict of per-group states, so memory is
+    bounded by the number of groups. Groups keep first-seen order. With
+    subtotals, the states of each first-level group (when grouping by several
+    columns) and of all groups are merged into bold summary rows. max_groups
+    caps the groups shown (per first-level group with subtotals, and the
+    first-level groups themselves); the rest are counted in dim
+    "… N more groups" rows but still count towards the totals.
+    """
+    keys = [group_by] if isinstance(group_by, str) else list(group_by)
+    specs = _aggregate_specs(aggregate)
+    aggregates = [_AGGREGATES[func] for _, _, func in specs]
+    updates = [(index, column, aggregates[index].update) for index, (_, column, _) in enumerate(specs)]
+    groups = {}
+    total = 0
+    for row in _iter_rows(data) if _columnar_rows(data, 0) is not None else data:
+        total += 1
+        group = tuple([row.get(key) for key in keys])
+        states = groups.get(group)
+        if states is None:
+            states = groups[group] = [aggregate.init() for aggregate in aggregates]
+        for index, column, update in updates:
+            value = True if column is None else row.get(column)
+            if value is not None:
+                states[index] = update(states[index], value)
+    
+    def result(labels, states):
+        row = dict(zip(keys, labels))
+        row.update((name, aggregate.result(state)) for (name, _, _), aggregate, state in zip(specs, aggregates, states))
+        return row
     
-    if len(data) > max_rows:
-        table.caption = f"Showing {max_rows} of {len(data)} rows"
+    def merged(group_states):
+        return functools.reduce(
+            lambda first, second: [aggregate.merge(a, b) for aggregate, a, b in zip(aggregates, first, second)],
+            group_states)
     
-    rprint(table)
+    rows, styles = [], []
+    if subtotals and len(keys) > 1:
+        blocks = {}
+        for group, states in groups.items():
+            blocks.setdefault(group[0], []).append((group, states))
+        for first, members in itertools.islice(blocks.items(), max_groups):
+            for group, states in members[:max_groups]:
+                rows.append(result(group, states))
+                styles.append(None)
+            if max_groups is not None and len(members) > max_groups:
+                rows.append(_more_groups(keys, len(members) - max_groups))
+                styles.append("dim")
+            rows.append(result((first, "Subtotal") + ("",) * (len(keys) - 2), merged([states for _, states in members])))
+            styles.append("bold")
+        if max_groups is not None and len(blocks) > max_groups:
+            hidden = sum(len(members) for members in itertools.islice(blocks.values(), max_groups, None))
+            rows.append(_more_groups(keys, hidden))
+            styles.append("dim")
+    else:
+        rows = [result(group, states) for group, states in itertools.islice(groups.items(), max_groups)]
+        styles = [None] * len(rows)
+        if max_groups is not None and len(groups) > max_groups:
+            rows.append(_more_groups(keys, len(groups) - max_groups))
+            styles.append("dim")
+    if subtotals and groups:
+        rows.append(result(("Total",) + ("",) * (len(keys) - 1), merged(list(groups.values()))))
+        styles.append("bold")
+    return rows, styles, len(groups), total
 
+# ============================================================================
+# ENHANCED DATA DISPLAY
+# ============================================================================
+
+def _plural(count: int, noun: str) -> str:
+    return f"{count:,} {noun}" + ("" if count == 1 else "s")
+
+def _collapsed(count: int, is_object: bool) -> str:
+    """Summary shown in place of a container beyond max_depth"""
+    return f"{{… {_plural(count, 'key')}}}" if is_object else f"[… {_plural(count, 'item')}]"
+
+def _short_string(value: str, max_string: Optional[int]) -> str:
+    if max_string is not None and len(value) > max_string:
+        return f"{value[:max_string]}… ({len(value):,} chars)"
+    return value
+
+def _limit_json(value: Any, max_depth: Optional[int], max_items: Optional[int], max_string: Optional[int],
+                depth: int = 0) -> Any:
+    """Copy of value with deep containers, long containers and long strings collapsed into summaries.
+
+    Only the nodes that will be shown are visited; the sizes of collapsed parts
+    come from len(), so the cost is bounded by the output, not the input.
+    """
+    if isinstance(value, Mapping):
+        if max_depth is not None and depth >= max_depth and value:
+            return _collapsed(len(value), True)
+        items = value.items()
+        more = 0 if max_items is None else len(value) - max_items
+        if more > 0:
+            items = itertools.islice(items, max_items)
+        limited = {key: _limit_json(item, max_depth, max_items, max_string, depth + 1) for key, item in items}
+        if more > 0:
+            limited["…"] = f"{_plural(more, 'more key')}"
+        return limited
+    if isinstance(value, (list, tuple)):
+        if max_depth is not None and depth >= max_depth and value:
+            return _collapsed(len(value), False)
+        more = 0 if max_items is None else len(value) - max_items
+        limited = [_limit_json(item, max_depth, max_items, max_string, depth + 1)
+                   for item in (value[:max_items] if more > 0 else value)]
+        if more > 0:
+            limited.append(f"… {_plural(more, 'more item')}")
+        return limited
+    if isinstance(value, str):
+        return _short_string(value, max_string)
+    return value
+
+_PATH_TOKEN = re.compile(r"""
+    (?P<descend>\.\.)
+  | \.?(?P<name>[^.\[\]'"\s]+)
+  | \[\s*(?P<index>-?\d+)\s*\]
+  | \[\s*(?P<start>-?\d*)\s*:\s*(?P<stop>-?\d*)\s*\]
+  | \[\s*(?P<quote>['"])(?P<key>.*?)(?P=quote)\s*\]
+  | \[\s*(?P<all>\*)\s*\]
+""", re.VERBOSE)
+
+def _select_key(key: str) -> Callable:
+    def step(matches):
+        for path, node in matches:
+            if isinstance(node, Mapping) and key in node:
+                yield path + (key,), node[key]
+    return step
+
+def _select_items(indices: Callable) -> Callable:
+    """Step over the array elements (or object values) chosen by indices(length), a range"""
+    def step(matches):
+        for path, node in matches:
+            if isinstance(node, Mapping):
+                if indices is None:
+                    for key, value in node.items():
+                        yield path + (key,), value
+            elif isinstance(node, (list, tuple)):
+                for index in (range(len(node)) if indices is None else indices(len(node))):
+                    yield path + (index,), node[index]
+    return step
+
+def _select_descendants(matches):
+    """Each match and, depth first, every node below it (the .. operator)"""
+    stack = list(matches)[::-1]
+    while stack:
+        path, node = stack.pop()
+        yield path, node
+        if isinstance(node, Mapping):
+            stack.extend(reversed([(path + (key,), value) for key, value in node.items()]))
+        elif isinstance(node, (list, tuple)):
+            stack.extend(reversed([(path + (index,), value) for index, value in enumerate(node)]))
+
+@functools.lru_cache(maxsize=256)
+def _compile_json_path(expression: str) -> tuple:
+    """Steps of a JSONPath-like expression such as "results[*].score".
+
+    Supports an optional leading "$", .key or ["key"], [n] (negative counts
+    from the end), [start:stop], * and [*] (all children) and ..key
+    (that key at any depth). Each step maps an iterator of (path, node)
+    matches to the next one.
+    """
+    text = expression.strip()
+    pos = 1 if text.startswith("$") else 0
+    steps = []
+    while pos < len(text):
+        match = _PATH_TOKEN.match(text, pos)
+        if match is None:
+            raise ValueError(f"invalid path expression {expression!r} at position {pos}")
+        pos = match.end()
+        if match.group("descend"):
+            if pos == len(text):
+                raise ValueError(f"invalid path expression {expression!r}: '..' needs a key")
+            steps.append(_select_descendants)
+        elif match.group("name") == "*" or match.group("all"):
+            steps.append(_select_items(None))
+        elif match.group("name") is not None:
+            steps.append(_select_key(match.group("name")))
+        elif match.group("key") is not None:
+            steps.append(_select_key(match.group("key")))
+        elif match.group("index") is not None:
+            index = int(match.group("index"))
+            steps.append(_select_items(
+                lambda length, index=index: (index if index >= 0 else length + index,)
+                if -length <= index < length else ()))
+        else:
+            bounds = slice(int(match.group("start")) if match.group("start") else None,
+                           int(match.group("stop")) if match.group("stop") else None)
+            steps.append(_select_items(lambda length, bounds=bounds: range(*bounds.indices(length))))
+    return tuple(steps)
+
+def _json_path(path: tuple) -> str:
+    """Path of a selected node as an expression, e.g. results[3].score"""
+    parts = []
+    for segment in path:
+        if isinstance(segment, int) and not isinstance(segment, bool):
+            parts.append(f"[{segment}]")
+            continue
+        # Other non-string keys (None, True, tuples) are shown as their str()
+        segment = str(segment)
+        if re.fullmatch(r"[^.\[\]'\"\s]+", segment):
+            parts.append(f".{segment}" if parts else segment)
+        else:
+            parts.append(f"[{_json()[2](segment)}]")
+    return "".join(parts) or "$"
+
+def _select_json(data: Any, expression: str) -> Iterable[tuple]:
+    """(path, node) for each node of data matched by a path expression"""
+    matches = iter([((), data)])
+    for step in _compile_json_path(expression):
+        matches = step(matches)
+    return matches
+
+def _json_renderable(data: Any) -> Text:
+    """Highlighted JSON text for data, serialized by the JSON backend; what rich's JSON renders, built
+    with public API only"""
+    from rich.highlighter import JSONHighlighter
+    text = JSONHighlighter()(_json()[2](data, indent=True))
+    text.no_wrap = True
+    text.overflow = None
+    return text
+
+@_leveled("info")
+def display_json(data: Union[Dict, List, str, bytes], title: str = "Data", max_depth: Optional[int] = None,
+                 max_items: Optional[int] = None, max_string: Optional[int] = None, select: Optional[str] = None):
+    """Display JSON with syntax highlighting.
+
+    Strings and bytes are parsed and data is serialized with the fastest JSON
+    library installed (see set_json_backend); datetimes, UUIDs, dataclasses
+    and NumPy values are shown as JSON. max_depth, max_items (per
+    array/object) and max_string collapse what lies beyond them into
+    summaries such as "… 48,213 more items" before the data is serialized and
+    highlighted, so huge payloads render in bounded time.
+
+    select is a path expression such as "results[*].score" or "..id"; only
+    the matching nodes are shown, keyed by their paths.
+    """
+    from rich.panel import Panel
+    if isinstance(data, (str, bytes)):
+        try:
+            data = _json()[1](data)
+        except ValueError:
+            _emit(f"[red]Invalid JSON string[/red]")
+            return
+    
+    subtitle = None
+    if select is not None:
+        # Matches are keyed by their paths; only the shown ones are formatted
+        matches = list(_select_json(data, select))
+        if not matches:
+            _emit(f"[dim]{title}: no matches for {select}[/dim]")
+            return
+        subtitle = f"[dim]{select} · {len(matches):,} {'match' if len(matches) == 1 else 'matches'}[/dim]"
+        more = 0 if max_items is None else len(matches) - max_items
+        data = {_json_path(path): _limit_json(node, max_depth, max_items, max_string, 1)
+                for path, node in (matches[:max_items] if more > 0 else matches)}
+        if more > 0:
+            data["…"] = f"{more:,} more {'match' if more == 1 else 'matches'}"
+    elif max_depth is not None or max_items is not None or max_string is not None:
+        data = _limit_json(data, max_depth, max_items, max_string)
+    panel = Panel(_json_renderable(data), title=f"[bold cyan]{title}[/bold cyan]", subtitle=subtitle,
+                  border_style="cyan")
+    _emit(panel)
+
+class _JsonFileReader:
+    """Reads the shown parts of a JSON document from a buffer (e.g. an mmap), skipping the rest.
+
+    Values within the limits are parsed node by node. Everything else is
+    skipped by a regex scan that only tracks nesting and counts direct
+    children, so memory stays constant however large the document is.
+    """
+
+    _SPACE = re.compile(rb"[ \t\n\r]*")
+    _SCALAR = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?'
+                         rb'|true|false|null')
+    _STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"')
+    _STRUCTURE = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},]')
+    # For _scan: balanced bracket pairs with only commas inside, the brackets,
+    # and every byte but brackets, commas and quotes
+    _PAIR = re.compile(rb"\[,*\]|\{,*\}")
+    _BRACKET = re.compile(rb"[\[\]{}]")
+    _NOT_STRUCTURE = bytes(sorted(set(range(256)) - set(b'[]{},"')))
+    _CHUNK = 1 << 20
+
+    def __init__(self, buffer: Any, max_depth: Optional[int], max_items: Optional[int], max_string: Optional[int]):
+        self.buffer = buffer
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.max_string = max_string
+        self.loads = _json()[1]
+
+    def document(self) -> Any:
+        value, end = self.read(0, 0)
+        if self._space(end) != len(self.buffer):
+            raise ValueError(f"extra data at byte {end:,}")
+        return value
+
+    def read(self, pos: int, depth: int) -> tuple:
+        """The value starting at pos (after whitespace) and the position after it"""
+        pos = self._space(pos)
+        char = self.buffer[pos:pos + 1]
+        if char == b"{" or char == b"[":
+            if self.max_depth is not None and depth >= self.max_depth:
+                end, count = self._skip(pos)
+                return (_collapsed(count, char == b"{") if count else ({} if char == b"{" else [])), end
+            return (self._object if char == b"{" else self._array)(pos + 1, depth)
+        match = self._SCALAR.match(self.buffer, pos)
+        if match is None:
+            raise ValueError(f"invalid JSON value at byte {pos:,}")
+        value = self.loads(match.group())
+        return (_short_string(value, self.max_string) if isinstance(value, str) else value), match.end()
+
+    def _array(self, pos: int, depth: int) -> tuple:
+        items = []
+        pos = self._space(pos)
+        if self.buffer[pos:pos + 1] == b"]":
+            return items, pos + 1
+        while True:
+            if self.max_items is not None and len(items) >= self.max_items:
+                end, commas = self._scan(pos)
+                items.append(f"… {_plural(commas + 1, 'more item')}")
+                return items, end
+            value, pos = self.read(pos, depth + 1)
+            items.append(value)
+            pos, char = self._separator(pos, b"]")
+            if char == b"]":
+                return items, pos
+
+    def _object(self, pos: int, depth: int) -> tuple:
+        result = {}
+        pos = self._space(pos)
+        if self.buffer[pos:pos + 1] == b"}":
+            return result, pos + 1
+        while True:
+            if self.max_items is not None and len(result) >= self.max_items:
+                end, commas = self._scan(pos)
+                result["…"] = _plural(commas + 1, "more key")
+                return result, end
+            pos = self._space(pos)
+            match = self._SCALAR.match(self.buffer, pos)
+            if match is None or self.buffer[pos:pos + 1] != b'"':
+                raise ValueError(f"expected a key at byte {pos:,}")
+            key = self.loads(match.group())
+            pos = self._space(match.end())
+            if self.buffer[pos:pos + 1] != b":":
+                raise ValueError(f"expected ':' at byte {pos:,}")
+            result[key], pos = self.read(pos + 1, depth + 1)
+            pos, char = self._separator(pos, b"}")
+            if char == b"}":
+                return result, pos
+
+    def _space(self, pos: int) -> int:
+        return self._SPACE.match(self.buffer, pos).end()
+
+    def _separator(self, pos: int, closing: bytes) -> tuple:
+        """Position after the "," or closing bracket following a member, and which one it was"""
+        pos = self._space(pos)
+        char = self.buffer[pos:pos + 1]
+        if char != b"," and char != closing:
+            raise ValueError(f"expected ',' or {closing.decode()!r} at byte {pos:,}")
+        return pos + 1, char
+
+    def _skip(self, pos: int) -> tuple:
+        """Position after the container starting at pos, and its number of direct children"""
+        inner = self._space(pos + 1)
+        if self.buffer[inner:inner + 1] in (b"]", b"}"):
+            return inner + 1, 0
+        end, commas = self._scan(inner)
+        return end, commas + 1
+
+    def _scan(self, pos: int) -> tuple:
+        """Position after the closing bracket of the container pos is in, and the commas at its level.
+
+        Works on chunks that end outside strings, using C-level bytes
+        operations: escaped backslashes and quotes are removed, every byte but
+        brackets, commas and quotes is dropped, and splitting on quotes keeps
+        the pieces outside strings. Balanced bracket pairs are then collapsed,
+        leaving only the few brackets that change the nesting level to walk in
+        Python. The chunk holding the closing bracket is rescanned token by
+        token to find its position.
+        """
+        buffer = self.buffer
+        depth = commas = 0
+        while pos < len(buffer):
+            chunk = buffer[pos:pos + self._CHUNK]
+            if b"\\" in chunk:
+                cleaned = chunk.replace(b"\\\\", b"").replace(b'\\"', b"")
+            else:
+                cleaned = chunk
+            pieces = cleaned.translate(None, self._NOT_STRUCTURE).split(b'"')
+            safe = len(chunk)
+            if len(pieces) % 2 == 0:
+                # The chunk ends inside a string: cut it at the string's opening quote
+                safe = self._opening_quote(chunk)
+                if safe == 0:  # a string longer than the chunk
+                    match = self._STRING.match(buffer, pos)
+                    if match is None:
+                        break
+                    pos = match.end()
+                    continue
+            structure = b"".join(pieces[::2])
+            collapsed = None
+            while collapsed != structure:
+                collapsed, structure = structure, self._PAIR.sub(b"", structure)
+            start_depth, start_commas, last = depth, commas, 0
+            for match in self._BRACKET.finditer(structure):
+                if depth == 0:
+                    commas += structure.count(b",", last, match.start())
+                last = match.end()
+                if structure[match.start()] in b"[{":
+                    depth += 1
+                elif depth == 0:
+                    return self._scan_tokens(pos, start_depth, start_commas)
+                else:
+                    depth -= 1
+            if depth == 0:
+                commas += structure.count(b",", last)
+            pos += safe
+        raise ValueError("unexpected end of JSON data")
+
+    @staticmethod
+    def _opening_quote(chunk: bytes) -> int:
+        """Index of the last quote in chunk that is not escaped by a backslash"""
+        index = chunk.rfind(b'"')
+        while index > 0:
+            start = index
+            while start > 0 and chunk[start - 1] == 0x5C:
+                start -= 1
+            if (index - start) % 2 == 0:
+                return index
+            index = chunk.rfind(b'"', 0, index)
+        return max(index, 0)
+
+    def _scan_tokens(self, pos: int, depth: int, commas: int) -> tuple:
+        """_scan one token at a time, starting depth levels inside the container"""
+        buffer = self.buffer
+        for match in self._STRUCTURE.finditer(buffer, pos):
+            char = buffer[match.start()]
+            if char == 0x22:  # a string, skipped whole
+                continue
+            if char == 0x2C:
+                if depth == 0:
+                    commas += 1
+            elif char == 0x5B or char == 0x7B:
+                depth += 1
+            elif depth == 0:
+                return match.end(), commas
+            else:
+                depth -= 1
+        raise ValueError("unexpected end of JSON data")
+
+@_leveled("info")
+def display_json_file(path: Union[str, os.PathLike], title: Optional[str] = None, max_depth: Optional[int] = 3,
+                      max_items: Optional[int] = 20, max_string: Optional[int] = 200):
+    """Display a JSON file of any size without loading it.
+
+    The file is memory-mapped and only the parts within max_depth, max_items
+    and max_string are parsed (see display_json); the rest is scanned to
+    count what was left out, in constant memory.
+    """
+    from rich.filesize import decimal
+    from rich.panel import Panel
+    try:
+        with open(path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            if size == 0:
+                raise ValueError("empty file")
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                if hasattr(buffer, "madvise"):
+                    buffer.madvise(mmap.MADV_SEQUENTIAL)
+                data = _JsonFileReader(buffer, max_depth, max_items, max_string).document()
+    except (OSError, ValueError) as error:
+        _emit(f"[red]Cannot display JSON file {path}: {error}[/red]")
+        return
+    
+    panel = Panel(_json_renderable(data), title=f"[bold cyan]{title or os.path.basename(path)}[/bold cyan]",
+                  subtitle=f"[dim]{decimal(size)}[/dim]", border_style="cyan")
+    _emit(panel)
+
+class _ById(namedtuple("_ById", "key value")):
+    """Path segment for an array element matched by its id key"""
+
+def _element_ids(items: List[Any], id_key: Optional[str]) -> Optional[List[Any]]:
+    """Ids of items if every item is an object with a distinct, hashable id_key, else None"""
+    if id_key is None or not items or type(items[0]) in _JSON_SCALARS:
+        return None
+    if not _is_object(items[0]) or id_key not in items[0]:
+        return None
+    if not all(_is_object(item) and id_key in item for item in items):
+        return None
+    ids = [item[id_key] for item in items]
+    try:
+        return ids if len(set(ids)) == len(ids) else None
+    except TypeError:
+        return None
+
+_JSON_SCALARS = frozenset({str, int, float, bool, type(None)})
+
+def _is_object(value: Any) -> bool:
+    # Plain dicts skip the slower ABC check
+    return type(value) is dict or isinstance(value, Mapping)
+
+def _same_leaf(old: Any, new: Any) -> bool:
+    """Whether old and new are the same object, or equal scalars of the same type"""
+    return old is new or (type(old) is type(new) and type(old) in _JSON_SCALARS and old == new)
+
+def _flat_path(node: Optional[tuple]) -> tuple:
+    """Path tuple of a linked path node: None for the root, (parent, key) or (parent, id, id_key)"""
+    segments = []
+    while node is not None:
+        segments.append(node[1] if len(node) == 2 else _ById(node[2], node[1]))
+        node = node[0]
+    return tuple(reversed(segments))
+
+def _diff_json(old: Any, new: Any, id_key: Optional[str]) -> Iterable[tuple]:
+    """(path, "added" | "removed" | "changed", old value, new value) for each difference.
+
+    Objects are compared key by key and arrays element by element, or by id
+    when every element of both arrays has a distinct id_key. Only scalars are
+    compared; containers are walked once with an explicit stack (skipping
+    values that are the same object) and paths are linked nodes flattened
+    only for reported changes, so the cost is linear in the size of the
+    documents. A container's added and removed entries come before the
+    changes inside its children. Arrays without ids are aligned by position
+    after trimming their common prefix and suffix of equal scalars: an
+    insertion into an array of strings is one addition, but in an array of
+    objects without ids every later element shows as changed.
+    """
+    scalars = _JSON_SCALARS
+    stack = [(None, old, new)]
+    while stack:
+        path, old, new = stack.pop()
+        if isinstance(old, list) and isinstance(new, list):
+            old_ids, new_ids = _element_ids(old, id_key), _element_ids(new, id_key)
+            if old_ids is not None and new_ids is not None:
+                new_by_id = dict(zip(new_ids, new))
+                children = []
+                for ident, value in zip(old_ids, old):
+                    other = new_by_id.get(ident, _MISSING)
+                    if other is _MISSING:
+                        yield _flat_path((path, ident, id_key)), "removed", value, None
+                    elif other is not value:
+                        children.append(((path, ident, id_key), value, other))
+                old_set = set(old_ids)
+                for ident, value in zip(new_ids, new):
+                    if ident not in old_set:
+                        yield _flat_path((path, ident, id_key)), "added", None, value
+                stack.extend(reversed(children))
+                continue
+            start, old_stop, new_stop = 0, len(old), len(new)
+            limit = min(old_stop, new_stop)
+            while start < limit and _same_leaf(old[start], new[start]):
+                start += 1
+            if start == old_stop == new_stop:
+                continue
+            while old_stop > start and new_stop > start and _same_leaf(old[old_stop - 1], new[new_stop - 1]):
+                old_stop -= 1
+                new_stop -= 1
+            common = min(old_stop, new_stop)
+            for index in range(common, old_stop):
+                yield _flat_path((path, index)), "removed", old[index], None
+            for index in range(common, new_stop):
+                yield _flat_path((path, index)), "added", None, new[index]
+            stack.extend(((path, index), old[index], new[index]) for index in range(common - 1, start - 1, -1)
+                         if not _same_leaf(old[index], new[index]))
+        elif (type(old) is dict or isinstance(old, Mapping)) and (type(new) is dict or isinstance(new, Mapping)):
+            children = []
+            for key, value in old.items():
+                if key not in new:
+                    yield _flat_path((path, key)), "removed", value, None
+                    continue
+                other = new[key]
+                if value is other or (type(value) is type(other) and type(value) in scalars and value == other):
+                    continue
+                children.append(((path, key), value, other))
+            for key, value in new.items():
+                if key not in old:
+                    yield _flat_path((path, key)), "added", None, value
+            stack.extend(reversed(children))
+        elif type(old) is not type(new) or old != new:
+            yield _flat_path(path), "changed", old, new
+
+def _path_label(segment: Any) -> str:
+    if isinstance(segment, _ById):
+        return f"[{segment.key}={_json()[2](segment.value)}]"
+    if isinstance(segment, int):
+        return f"[{segment}]"
+    return str(segment)
+
+def _json_preview(value: Any) -> str:
+    """One-line JSON of value, with nested containers summarised"""
+    return _truncate(_json()[2](_limit_json(value, 1, 5, 40)), 80)
+
+@_leveled("info")
+def display_json_diff(old: Union[Dict, List, str, bytes], new: Union[Dict, List, str, bytes],
+                      title: str = "JSON Diff", id_key: Optional[str] = "id", max_changes: int = 100):
+    """Display the structural differences between two JSON documents.
+
+    Only changed paths are shown, as a tree under their parent keys: added
+    (+), removed (-) and changed (~, old → new) values. Array elements are
+    matched by id_key when all of them have a distinct one, else by
+    position. At most max_changes changes are shown; all are counted.
+    """
+    from rich.tree import Tree
+    documents = []
+    for document in (old, new):
+        if isinstance(document, (str, bytes)):
+            try:
+                document = _json()[1](document)
+            except ValueError:
+                _emit(f"[red]Invalid JSON string[/red]")
+                return
+        documents.append(document)
+    
+    tree = Tree(f"[bold blue]{title}[/bold blue]")
+    nodes = {(): tree}
+    counts = {"added": 0, "removed": 0, "changed": 0}
+    shown = 0
+    for path, kind, before, after in _diff_json(documents[0], documents[1], id_key):
+        counts[kind] += 1
+        if shown >= max_changes:
+            continue
+        shown += 1
+        # Ancestors of the change are its context
+        for depth in range(1, len(path)):
+            if path[:depth] not in nodes:
+                nodes[path[:depth]] = nodes[path[:depth - 1]].add(Text(_path_label(path[depth - 1]), style="bold"))
+        label = _path_label(path[-1]) if path else "(root)"
+        if kind == "added":
+            line = Text.assemble(("+ ", "bold green"), (label, "green"), ": ", (_json_preview(after), "green"))
+        elif kind == "removed":
+            line = Text.assemble(("- ", "bold red"), (label, "red"), ": ", (_json_preview(before), "red"))
+        else:
+            line = Text.assemble(("~ ", "bold yellow"), (label, "yellow"), ": ", (_json_preview(before), "red"),
+                                 " → ", (_json_preview(after), "green"))
+        nodes[path[:-1]].add(line)
+    
+    total = sum(counts.values())
+    if total == 0:
+        _emit(f"[green]✓ {title}: no differences[/green]")
+        return
+    if total > shown:
+        tree.add(Text(f"… {_plural(total - shown, 'more change')}", style="dim"))
+    _emit(tree)
+    _emit(Text(f"{counts['added']:,} added, {counts['removed']:,} removed, {counts['changed']:,} changed",
+               style="dim"))
+
+@_leveled("info")
+def display_table(data: Iterable[Dict], title: str = "Table", max_rows: int = 10, count_rows: bool = True,
+                  schema_sample: int = 1000, widths: Union[None, str, int, List[int], Dict[str, int]] = None,
+                  summary: bool = False, sort_by: Union[None, str, Callable[[Dict], Any]] = None,
+                  descending: bool = False, top_k: Optional[int] = None,
+                  formatters: Optional[Dict[str, Union[str, Callable[[Any], str]]]] = None,
+                  group_by: Union[None, str, List[str]] = None, aggregate: Optional[Dict[str, Any]] = None,
+                  subtotals: bool = False):
+    """Create table from list of dictionaries, any iterable of them, or columnar data
+    (dict of lists, NumPy structured array, pandas DataFrame, pyarrow Table).
+    With summary=True, show per-column statistics over all rows instead of the rows.
+    With sort_by (a column or a function of the row), show the top_k rows (default
+    max_rows) in that order, holding only those rows in memory. formatters maps
+    columns to a format spec (".2f") or function overriding set_formatter.
+    With group_by, show one row per group with the aggregate columns, e.g.
+    {"n": "count", "score": "mean", "best": ("score", "max")}, plus subtotal rows;
+    at most max_rows groups (top_k when sorted) are shown, per first-level group
+    with subtotals."""
+    if _no_rows(data):
+        display_warning("No data for table")
+        return
+    if summary:
+        rows, total = _summarize(data)
+        if not rows:
+            display_warning("No data for table")
+            return
+        schema = _Schema()
+        for row in rows:
+            schema.add(row)
+        table = _build_table(f"{title} Summary", rows, schema, widths)
+        table.caption = f"{total:,} rows"
+        _emit(table)
+        return
+    
+    styles = None
+    if group_by is not None:
+        if sort_by is None:
+            rows, styles, groups, total = _group_rows(data, group_by, aggregate, subtotals, max_rows)
+        else:
+            # Sorting reorders the groups, so of the subtotal rows only the grand total is kept
+            rows, styles, groups, total = _group_rows(data, group_by, aggregate, subtotals)
+            shown = [row for row, style in zip(rows, styles) if style is None]
+            grand_total = rows[-1:] if subtotals else []
+            rows = _top_rows(shown, sort_by, top_k if top_k is not None else max_rows, descending)[0]
+            styles = [None] * len(rows)
+            if len(shown) > len(rows):
+                keys = [group_by] if isinstance(group_by, str) else list(group_by)
+                rows.append(_more_groups(keys, len(shown) - len(rows)))
+                styles.append("dim")
+            rows += grand_total
+            styles += ["bold"] * len(grand_total)
+        schema = _Schema()
+        for row in rows:
+            schema.add(row)
+    elif sort_by is not None:
+        rows, total = _top_rows(data, sort_by, top_k if top_k is not None else max_rows, descending)
+        schema = _Schema()
+        for row in rows:
+            schema.add(row)
+    else:
+        rows, total, schema = _take_rows(data, max_rows, count_rows, schema_sample)
+    if not rows:
+        display_warning("No data for table")
+        return
+    
+    table = _build_table(title, rows, schema, widths, formatters, styles)
+    
+    if group_by is not None:
+        table.caption = f"{groups:,} groups from {total:,} rows"
+    elif sort_by is not None:
+        order = "descending" if descending else "ascending"
+        by = getattr(sort_by, "__name__", "key") if callable(sort_by) else sort_by
+        by = "key" if by == "<lambda>" else by
+        table.caption = f"Top {len(rows)} of {total:,} rows by {by} ({order})"
+    elif total is None:
+        table.caption = f"Showing {len(rows)} of {len(rows)}+ rows"
+    elif total > len(rows):
+        table.caption = f"Showing {len(rows)} of {total} rows"
+    
+    _emit(table)
+
+@_leveled("info")
+def display_table_pager(data: Iterable[Dict], title: str = "Table", page_size: int = 20,
+                        widths: Union[None, str, int, List[int], Dict[str, int]] = "auto",
+                        formatters: Optional[Dict[str, Union[str, Callable[[Any], str]]]] = None):
+    """Browse a large table page by page (n/p for next/previous, a row number to jump, q to quit)"""
+    from rich.prompt import Prompt
+    if _no_rows(data):
+        display_warning("No data for table")
+        return
+    source = _PagedRows(data, cache_rows=max(1000, page_size))
+    start = 0
+    while True:
+        start, rows = source.page(start, page_size)
+        if not rows and start > 0:
+            start = max(0, source.known_rows - page_size)
+            continue
+        if not rows:
+            display_warning("No data for table")
+            return
+        schema = _Schema()
+        for row in rows:
+            schema.add(row)
+        
+        table = _build_table(title, rows, schema, widths, formatters)
+        total = f"{source.total:,}" if source.total is not None else f"{source.known_rows:,}+"
+        table.caption = f"Rows {start + 1:,}-{start + len(rows):,} of {total}"
+        _emit(table)
+        
+        if not sys.stdin.isatty():
+            return
+        # Flushes an enclosing display_batch too, so the table is shown before the prompt
+        flush_output()
+        choice = Prompt.ask("[cyan]\\[n]ext, \\[p]revious, row number or \\[q]uit[/cyan]", default="n").strip().lower()
+        if choice == "q":
+            return
+        if choice == "p":
+            start = max(0, start - page_size)
+        elif choice.replace(",", "").isdigit():
+            start = max(0, int(choice.replace(",", "")) - 1)
+        else:
+            start += page_size
+
+class LiveTable:
+    """Table that updates in place as rows are appended, updated by key or removed.
+
+    Use as a context manager. Columns get fixed widths (see display_table's
+    widths) so each row is laid out on its own and cached; a refresh only
+    re-lays out rows that changed since the last frame. Frames are drawn by
+    rich Live at most max_fps times per second, however often rows change.
+    """
+
+    def __init__(self, title: str = "Table", key: Optional[str] = None,
+                 widths: Union[str, int, List[int], Dict[str, int]] = "auto",
+                 max_fps: float = 10, max_rows: Optional[int] = None,
+                 formatters: Optional[Dict[str, Union[str, Callable[[Any], str]]]] = None):
+        self.title = title
+        self.key = key
+        self.widths = widths
+        self.max_fps = max_fps
+        self.max_rows = max_rows
+        self.formatters = formatters
+        self._rows = {}  # row key -> (version, row)
+        self._schema = _Schema()
+        self._layout = None  # (columns, labels, widths), rebuilt when columns or auto widths change
+        self._seen_widths = {}  # column -> widest value stored so far, capped at 50
+        self._line_cache = {}  # row key -> (version, segments)
+        self._version = 0
+        self._next_key = 0
+        self._lock = threading.RLock()
+        self._live = None
+
+    def append(self, row: Dict) -> Any:
+        """Add a row and return its key (row[key] if a key column was given)"""
+        with self._lock:
+            if self.key is not None:
+                row_key = row[self.key]
+            else:
+                row_key = self._next_key
+                self._next_key += 1
+            self._store(row_key, row)
+            return row_key
+
+    def update(self, row_key: Any, row: Optional[Dict] = None, **changes):
+        """Replace the row stored under row_key, or change some of its fields"""
+        with self._lock:
+            current = dict(self._rows[row_key][1]) if row is None else dict(row)
+            current.update(changes)
+            self._store(row_key, current)
+
+    def remove(self, row_key: Any):
+        """Remove the row stored under row_key"""
+        with self._lock:
+            self._rows.pop(row_key, None)
+            self._line_cache.pop(row_key, None)
+
+    def _store(self, row_key: Any, row: Dict):
+        self._version += 1
+        self._rows[row_key] = (self._version, row)
+        self._schema.add(row)
+        for key, value in row.items():
+            if value is None:
+                continue
+            if self.formatters and key in self.formatters:
+                text = _as_formatter(self.formatters[key])(value)
+            else:
+                text = _format_any(value)
+            text = _single_line(text)
+            width = min(50, len(text) if text.isascii() else cell_len(text))
+            if width > self._seen_widths.get(key, 0):
+                self._seen_widths[key] = width
+                if self.widths == "auto":
+                    # Auto widths only grow (up to 50), so full re-layouts stay rare
+                    self._layout = None
+
+    def __enter__(self):
+        if not _use_plain():
+            from rich.live import Live
+            flush_output()
+            self._live = Live(self, console=console, refresh_per_second=self.max_fps)
+            self._live.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._live is not None:
+            self._live.stop()
+            self._live = None
+        else:
+            rows = [row for _, row in self._rows.values()]
+            display_table(rows, self.title, max_rows=len(rows), widths=self.widths, formatters=self.formatters)
+
+    def _get_layout(self) -> tuple:
+        columns = self._schema.columns
+        if self._layout is None or self._layout[0] != columns:
+            labels = [str(key).replace('_', ' ').title() for key in columns]
+            auto = [max(cell_len(label), self._seen_widths.get(key, 0)) for key, label in zip(columns, labels)]
+            self._layout = (columns, labels, _column_widths(self.widths, columns, auto))
+            self._line_cache.clear()
+        return self._layout
+
+    def _row_segments(self, cells: List[str], widths: List[int], justify: List[str], style) -> list:
+        from rich.box import ROUNDED
+        from rich.segment import Segment
+        segments = [Segment(ROUNDED.mid_left + " ")]
+        for index, (cell, width) in enumerate(zip(cells, widths)):
+            # Raw line breaks or tabs would break the borders of every row below
+            cell = _truncate(_single_line(cell), width)
+            padding = " " * (width - cell_len(cell))
+            segments.append(Segment(padding + cell if justify[index] == "right" else cell + padding, style))
+            last = index == len(widths) - 1
+            segments.append(Segment(" " + (ROUNDED.mid_right if last else ROUNDED.mid_vertical + " ")))
+        segments.append(Segment.line())
+        return segments
+
+    def __rich_console__(self, render_console, options):
+        from rich.box import ROUNDED
+        from rich.segment import Segment
+        with self._lock:
+            columns, labels, widths = self._get_layout()
+            if not columns:
+                return
+            justify = ["right" if self._schema.kind(key) == "number" else "left" for key in columns]
+            formats = _column_formatters(self._schema, columns, self.formatters)
+            padded = [width + 2 for width in widths]
+            table_width = sum(padded) + len(padded) + 1
+            
+            yield Segment(self.title.center(table_width).rstrip(), _style("bold blue"))
+            yield Segment.line()
+            yield Segment(ROUNDED.get_top(padded) + "\n")
+            yield from self._row_segments(labels, widths, ["left"] * len(columns), _style("bold"))
+            yield Segment(ROUNDED.get_row(padded, "head", edge=True) + "\n")
+            
+            shown = list(self._rows.items())
+            if self.max_rows is not None:
+                shown = shown[-self.max_rows:]
+            cyan = _style("cyan")
+            for row_key, (version, row) in shown:
+                cached = self._line_cache.get(row_key)
+                if cached is None or cached[0] != version:
+                    cells = _format_cells([row], columns, formats)[0]
+                    cached = self._line_cache[row_key] = (version, self._row_segments(cells, widths, justify, cyan))
+                yield from cached[1]
+            
+            yield Segment(ROUNDED.get_bottom(padded) + "\n")
+            if len(shown) < len(self._rows):
+                yield Segment(f"Showing last {len(shown)} of {len(self._rows)} rows".center(table_width).rstrip(), _style("dim"))
+                yield Segment.line()
+
+@_leveled("info")
 def display_tree(data: Dict[str, List], title: str = "Tree"):
     """Display hierarchical data as tree"""
+    from rich.tree import Tree
     tree = Tree(f"[bold blue]{title}[/bold blue]")
     
     for key, items in data.items():
@@ -124,40 +2619,47 @@ def display_tree(data: Dict[str, List], title: str = "Tree"):
             item_text = str(item)[:60] + ("..." if len(str(item)) > 60 else "")
             branch.add(f"[dim]{item_text}[/dim]")
     
-    rprint(tree)
+    _emit(tree)
 
+@_leveled("info")
 def display_code(code: str, language: str = "python", title: str = "Code"):
     """Display code with syntax highlighting"""
+    from rich.panel import Panel
+    from rich.syntax import Syntax
     syntax = Syntax(code, language, theme="monokai", line_numbers=True)
     panel = Panel(syntax, title=f"[bold green]{title}[/bold green]", border_style="green")
-    rprint(panel)
+    _emit(panel)
 
+@_leveled("info")
 def display_markdown(content: str):
     """Display markdown content"""
-    rprint(Markdown(content))
+    from rich.markdown import Markdown
+    _emit(Markdown(content))
 
 # ============================================================================
 # PROGRESS AND STATUS
 # ============================================================================
 
+@_leveled("progress")
 def display_progress_bar(current: int, total: int, description: str = "Progress"):
     """Simple progress indicator"""
     percentage = (current / total) * 100
     bar = "█" * int(percentage // 5) + "░" * (20 - int(percentage // 5))
-    rprint(f"[cyan]{description}: [{bar}] {current}/{total} ({percentage:.1f}%)[/cyan]")
+    _emit(f"[cyan]{description}: [{bar}] {current}/{total} ({percentage:.1f}%)[/cyan]")
 
 @contextlib.contextmanager
 def display_spinner(message: str):
     """Context manager for spinner during operations"""
+    flush_output()
     with console.status(f"[cyan]{message}[/cyan]", spinner="dots"):
         yield
 
 def display_countdown(seconds: int, message: str = "Waiting"):
     """Countdown timer"""
     for i in range(seconds, 0, -1):
-        rprint(f"[yellow]{message}: {i}s[/yellow]", end="\r")
+        _emit(f"[yellow]{message}: {i}s[/yellow]", end="\r")
         time.sleep(1)
-    rprint(f"[green]{message}: Done![/green]")
+    _emit(f"[green]{message}: Done![/green]")
 
 # ============================================================================
 # USER INPUT
@@ -165,30 +2667,42 @@ def display_countdown(seconds: int, message: str = "Waiting"):
 
 def display_ask(question: str) -> str:
     """Ask user a question"""
+    from rich.prompt import Prompt
+    flush_output()
     return Prompt.ask(f"[cyan]{question}[/cyan]")
 
 def display_ask_yes_no(question: str) -> bool:
     """Ask yes/no question"""
+    from rich.prompt import Confirm
+    flush_output()
     return Confirm.ask(f"[yellow]{question}[/yellow]")
 
 def display_ask_choice(question: str, choices: List[str]) -> str:
     """Ask user to choose from options"""
+    from rich.prompt import Prompt
+    flush_output()
     return Prompt.ask(f"[cyan]{question}[/cyan]", choices=choices)
 
 # ============================================================================
 # LAYOUT AND COLUMNS
 # ============================================================================
 
+@_leveled("info")
 def display_side_by_side(left_content: str, right_content: str, left_title: str = "Left", right_title: str = "Right"):
     """Display two panels side by side"""
+    from rich.columns import Columns
+    from rich.panel import Panel
     left_panel = Panel(left_content, title=f"[bold blue]{left_title}[/bold blue]", border_style="blue")
     right_panel = Panel(right_content, title=f"[bold green]{right_title}[/bold green]", border_style="green")
     
     columns = Columns([left_panel, right_panel], equal=True)
-    rprint(columns)
+    _emit(columns)
 
+@_leveled("info")
 def display_multi_column(contents: List[str], titles: List[str] = None, colors: List[str] = None):
     """Display multiple columns"""
+    from rich.columns import Columns
+    from rich.panel import Panel
     if not titles:
         titles = [f"Column {i+1}" for i in range(len(contents))]
     if not colors:
@@ -200,102 +2714,129 @@ def display_multi_column(contents: List[str], titles: List[str] = None, colors:
         panel = Panel(content, title=f"[bold {color}]{titles[i]}[/bold {color}]", border_style=color)
         panels.append(panel)
     
-    rprint(Columns(panels, equal=True))
+    _emit(Columns(panels, equal=True))
 
 # ============================================================================
 # ADVANCED DISPLAYS
 # ============================================================================
 
+@_leveled("info")
 def display_diff(old: str, new: str):
     """Display text differences"""
     display_side_by_side(old, new, "Before", "After")
 
+@_leveled("info")
 def display_key_value(data: Dict[str, Any], title: str = "Information"):
     """Display key-value pairs in formatted panel"""
+    from rich.panel import Panel
     content = ""
     for key, value in data.items():
         key_formatted = key.replace('_', ' ').title()
         content += f"[cyan]{key_formatted}:[/cyan] [white]{value}[/white]\n"
     
     panel = Panel(content.rstrip(), title=f"[bold blue]{title}[/bold blue]", border_style="blue")
-    rprint(panel)
+    _emit(panel)
 
+@_leveled("info")
 def display_list(items: List[str], title: str = "List", numbered: bool = True):
     """Display list with optional numbering"""
+    from rich.panel import Panel
     content = ""
     for i, item in enumerate(items, 1):
         prefix = f"{i}. " if numbered else "• "
         content += f"[cyan]{prefix}[/cyan][white]{item}[/white]\n"
     
     panel = Panel(content.rstrip(), title=f"[bold blue]{title}[/bold blue]", border_style="blue")
-    rprint(panel)
+    _emit(panel)
 
 # ============================================================================
 # BASIC MESSAGE TYPES
 # ============================================================================
 
+@_leveled("info")
 def display_info(message: str):
     """Blue info message"""
-    rprint(f"[blue]ℹ {message}[/blue]")
+    _emit(_styled_text(message, "blue", "ℹ "))
 
+@_leveled("success")
 def display_success(message: str):
     """Green success message"""
-    rprint(f"[green]✓ {message}[/green]")
+    _emit(_styled_text(message, "green", "✓ "))
 
+@_leveled("warning")
 def display_warning(message: str):
     """Yellow warning message"""
-    rprint(f"[yellow]⚠ {message}[/yellow]")
+    _emit(_styled_text(message, "yellow", "⚠ "))
 
+@_leveled("error")
 def display_error(message: str):
     """Red error message"""
-    rprint(f"[red]✗ {message}[/red]")
+    _emit(_styled_text(message, "red", "✗ "))
 
+@_leveled("debug")
 def display_debug(message: str):
     """Magenta debug message"""
-    rprint(f"[magenta][debug] {message}[/magenta]")
+    _emit(_styled_text(message, "magenta", "[debug] "), level="debug")
 
+@_leveled("progress")
 def display_progress_msg(message: str):
     """Cyan progress message"""
-    rprint(f"[cyan]▶ {message}[/cyan]")
+    text = _styled_text(message, "cyan", "▶ ")
+    if _coalescer is not None:
+        _coalescer.submit(("display_progress_msg", message), text)
+    else:
+        _emit(text)
 
 # ============================================================================
 # SPECIALIZED DISPLAYS FOR COMMON PATTERNS
 # ============================================================================
 
+@_leveled("info")
 def display_operation_start(operation: str, details: str = ""):
     """Start of any operation"""
     detail_msg = f" - {details}" if details else ""
-    rprint(f"\n[bold blue]{operation}[/bold blue]{detail_msg}")
+    _emit(f"\n[bold blue]{operation}[/bold blue]{detail_msg}")
 
+@_leveled("success")
 def display_operation_complete(operation: str, result: str = ""):
     """Operation completion"""
     result_msg = f" → {result}" if result else ""
-    rprint(f"[bold green]✓ {operation} Complete[/bold green]{result_msg}")
+    _emit(f"[bold green]✓ {operation} Complete[/bold green]{result_msg}")
 
+@_leveled("progress")
 def display_step_progress(current: int, total: int, description: str):
     """Step progress display"""
-    rprint(f"\n[bold cyan]Step {current}/{total}[/bold cyan]")
-    rprint(f"[cyan]{description}[/cyan]")
+    _emit(f"\n[bold cyan]Step {current}/{total}[/bold cyan]")
+    _emit(f"[cyan]{description}[/cyan]")
 
+@_leveled("info")
 def display_search_result(count: int, query: str):
     """Search results summary"""
-    rprint(f"[green]Found {count} results for '{query}'[/green]")
+    _emit(f"[green]Found {count} results for '{query}'[/green]")
 
+@_leveled("info")
 def display_connection_item(index: int, name: str, score: float, preview: str):
     """Individual connection/result item"""
-    rprint(f"   [yellow]{index}.[/yellow] [magenta]{name}[/magenta] Score: [green]{score:.3f}[/green]")
-    rprint(f"      [dim]{preview[:80]}...[/dim]")
+    _emit(f"   [yellow]{index}.[/yellow] [magenta]{name}[/magenta] Score: [green]{score:.3f}[/green]")
+    _emit(f"      [dim]{preview[:80]}...[/dim]")
 
+@_leveled("info")
 def display_decision_output(decision: str):
     """AI/system decision output"""
-    rprint(f"\n[bold yellow]Decision:[/bold yellow]")
-    rprint(f"[yellow]   {decision}[/yellow]")
+    _emit(f"\n[bold yellow]Decision:[/bold yellow]")
+    _emit(f"[yellow]   {decision}[/yellow]")
 
+@_leveled("progress")
 def display_status_update(message: str, count: int = None):
     """General status update"""
     count_msg = f" ({count})" if count is not None else ""
-    rprint(f"[green]{message}{count_msg}[/green]")
+    text = _styled_text(f"{message}{count_msg}", "green")
+    if _coalescer is not None:
+        _coalescer.submit(("display_status_update", message), text)
+    else:
+        _emit(text)
 
+@_leveled("info")
 def display_process_step(step_name: str, status: str = "processing"):
     """Generic process step"""
     status_colors = {
@@ -303,209 +2844,254 @@ def display_process_step(step_name: str, status: str = "processing"):
         "skipped": "dim", "warning": "yellow"
     }
     color = status_colors.get(status, "blue")
-    rprint(f"[{color}]{step_name}[/{color}]")
+    _emit(f"[{color}]{step_name}[/{color}]")
 
 # ============================================================================
 # PANELS AND SECTIONS
 # ============================================================================
 
+@_leveled("info")
 def display_section_panel(title: str, content: str, color: str = "blue"):
     """Fancy panel with title"""
+    from rich.panel import Panel
     panel = Panel(content, title=f"[bold {color}]{title}[/bold {color}]", border_style=color)
-    rprint(panel)
+    _emit(panel)
 
+@_leveled("info")
 def display_status_panel(message: str):
     """Status panel in yellow"""
+    from rich.panel import Panel
     panel = Panel(f"[yellow]{message}[/yellow]", border_style="yellow")
-    rprint(panel)
+    _emit(panel)
 
+@_leveled("success")
 def display_completion_panel(message: str):
     """Completion panel in green"""
+    from rich.panel import Panel
     panel = Panel(f"[green]{message}[/green]", border_style="green")
-    rprint(panel)
+    _emit(panel)
 
+@_leveled("error")
 def display_error_panel(message: str):
     """Error panel in red"""
+    from rich.panel import Panel
     panel = Panel(f"[red]{message}[/red]", border_style="red")
-    rprint(panel)
+    _emit(panel)
 
 # ============================================================================
 # DIVIDERS AND SEPARATORS
 # ============================================================================
 
+@_leveled("info")
 def display_divider(title: str = "", style: str = "="):
     """Section divider"""
+    from rich.rule import Rule
     if title:
-        rprint(Rule(f"[bold blue]{title}[/bold blue]", style=style))
+        _emit(Rule(f"[bold blue]{title}[/bold blue]", style=style))
     else:
-        rprint(Rule(style=style))
+        _emit(Rule(style=style))
 
+@_leveled("info")
 def display_thin_divider():
     """Thin separator line"""
-    rprint("[dim]" + "-" * 60 + "[/dim]")
+    _emit("[dim]" + "-" * 60 + "[/dim]")
 
 # ============================================================================
 # EXECUTION SUMMARY
 # ============================================================================
 
+@_leveled("info")
 def display_execution_summary(session_id: str, execution_time: float, question: str, artifacts_count: int):
     """Complete execution summary"""
-    rprint(f"\n[bold green]Pipeline Execution Complete[/bold green]")
-    rprint(f"[blue]  • Total Time: {execution_time:.2f} seconds[/blue]")
-    rprint(f"[blue]  • Session ID: {session_id}[/blue]")
-    rprint(f"[blue]  • Question: {question}[/blue]")
-    rprint(f"[blue]  • Artifacts Generated: {artifacts_count} files[/blue]")
+    _emit(f"\n[bold green]Pipeline Execution Complete[/bold green]")
+    _emit(f"[blue]  • Total Time: {execution_time:.2f} seconds[/blue]")
+    _emit(f"[blue]  • Session ID: {session_id}[/blue]")
+    _emit(f"[blue]  • Question: {question}[/blue]")
+    _emit(f"[blue]  • Artifacts Generated: {artifacts_count} files[/blue]")
 
+@_leveled("info")
 def display_artifact_list(artifacts: Dict[str, str]):
     """Display artifact list"""
-    rprint(f"\n[bold yellow]Generated Artifacts ({len(artifacts)} files):[/bold yellow]")
+    _emit(f"\n[bold yellow]Generated Artifacts ({len(artifacts)} files):[/bold yellow]")
     display_thin_divider()
     for artifact_type, path in artifacts.items():
-        rprint(f"  [cyan]• {artifact_type.replace('_', ' ').title()}:[/cyan] {path}")
+        _emit(f"  [cyan]• {artifact_type.replace('_', ' ').title()}:[/cyan] {path}")
 
 # ============================================================================
 # PROGRESS AND LOADING
 # ============================================================================
 
+@_leveled("info")
 def display_loading(message: str):
     """Loading message with spinner effect"""
-    rprint(f"[yellow]⏳ {message}...[/yellow]")
+    _emit(f"[yellow]⏳ {message}...[/yellow]")
 
+@_leveled("info")
 def display_pipeline_start(question: str):
     """Pipeline initialization"""
-    rprint("[bold blue]Deep Memory Research Pipeline[/bold blue]")
-    rprint(f"[blue]Research Question: {question}[/blue]")
-    rprint("[yellow]Starting comprehensive research...[/yellow]")
+    _emit("[bold blue]Deep Memory Research Pipeline[/bold blue]")
+    _emit(f"[blue]Research Question: {question}[/blue]")
+    _emit("[yellow]Starting comprehensive research...[/yellow]")
 
+@_leveled("info")
 def display_pipeline_init(session_id: str):
     """Pipeline initialization with session"""
-    rprint(f"[blue]Pipeline initialized - Session: {session_id}[/blue]")
+    _emit(f"[blue]Pipeline initialized - Session: {session_id}[/blue]")
 
 # ============================================================================
 # MEMORY AND SEARCH SPECIFIC
 # ============================================================================
 
+@_leveled("info")
 def display_search_term_extracted(term: str):
     """Extracted search term"""
-    rprint(f"[yellow]LLM extracted initial search term: '{term}'[/yellow]")
+    _emit(f"[yellow]LLM extracted initial search term: '{term}'[/yellow]")
 
+@_leveled("info")
 def display_memory_search_start(query: str):
     """Memory search initiation"""
-    rprint(f"[cyan]Searching: '{query}'[/cyan]")
+    text = _styled_text(f"Searching: '{query}'", "cyan")
+    if _coalescer is not None:
+        _coalescer.submit(("display_memory_search_start",), text)
+    else:
+        _emit(text)
 
+@_leveled("info")
 def display_no_memories_found():
     """No search results"""
-    rprint("[yellow]No connected memories found for this exploration[/yellow]")
+    _emit("[yellow]No connected memories found for this exploration[/yellow]")
 
+@_leveled("info")
 def display_memory_connections_header():
     """Header for memory connections list"""
-    rprint("[bold yellow]Memory Connections Discovered:[/bold yellow]")
+    _emit("[bold yellow]Memory Connections Discovered:[/bold yellow]")
 
+@_leveled("success")
 def display_research_complete():
     """Research completion message"""
-    rprint("[bold green]Strategic research complete - enough information gathered![/bold green]")
+    _emit("[bold green]Strategic research complete - enough information gathered![/bold green]")
 
+@_leveled("info")
 def display_generating_report():
     """Final report generation"""
-    rprint("[yellow]Generating final report...[/yellow]")
+    _emit("[yellow]Generating final report...[/yellow]")
 
 # ============================================================================
 # ERROR HANDLING
 # ============================================================================
 
+@_leveled("error")
 def display_api_error(error_msg: str):
     """API-related errors"""
-    rprint(f"[red]API Error: {error_msg}[/red]")
+    _emit(f"[red]API Error: {error_msg}[/red]")
 
+@_leveled("warning")
 def display_tracker_error(error_msg: str):
     """Memory tracker errors"""
-    rprint(f"[yellow]Warning: {error_msg}[/yellow]")
+    _emit(f"[yellow]Warning: {error_msg}[/yellow]")
 
+@_leveled("warning")
 def display_fallback_notice(message: str):
     """Fallback operation notice"""
-    rprint(f"[yellow]Fallback: {message}[/yellow]")
+    _emit(f"[yellow]Fallback: {message}[/yellow]")
 
 # ============================================================================
 # PIPELINE STATUS
 # ============================================================================
 
+@_leveled("success")
 def display_pipeline_complete():
     """Pipeline completion"""
     display_divider("Research Complete")
-    rprint("[bold green]Research pipeline complete![/bold green]")
+    _emit("[bold green]Research pipeline complete![/bold green]")
 
+@_leveled("error")
 def display_pipeline_failed(error: str):
     """Pipeline failure"""
-    rprint(f"[bold red]Pipeline failed: {error}[/bold red]")
+    _emit(f"[bold red]Pipeline failed: {error}[/bold red]")
 
+@_leveled("info")
 def display_memory_storage_prompt():
     """Memory storage user prompt"""
     display_divider()
-    rprint("[bold yellow]Research pipeline complete![/bold yellow]")
+    _emit("[bold yellow]Research pipeline complete![/bold yellow]")
 
+@_leveled("success")
 def display_memory_stored(count: int):
     """Memory storage success"""
-    rprint(f"[green]Stored {count} research insights as memories[/green]")
+    _emit(f"[green]Stored {count} research insights as memories[/green]")
 
+@_leveled("info")
 def display_memory_skipped():
     """Memory storage skipped"""
-    rprint("[yellow]Skipping memory storage[/yellow]")
+    _emit("[yellow]Skipping memory storage[/yellow]")
 
 # ============================================================================
 # TESTING AND VERIFICATION
 # ============================================================================
 
+@_leveled("info")
 def display_test_start(test_name: str):
     """Test initiation"""
-    rprint(f"[yellow]Testing {test_name}[/yellow]")
+    _emit(f"[yellow]Testing {test_name}[/yellow]")
 
+@_leveled("success")
 def display_test_success(message: str):
     """Test success"""
-    rprint(f"[green]✓ {message}[/green]")
+    _emit(f"[green]✓ {message}[/green]")
 
+@_leveled("error")
 def display_test_failure(message: str):
     """Test failure"""
-    rprint(f"[red]✗ {message}[/red]")
+    _emit(f"[red]✗ {message}[/red]")
 
 # ============================================================================
 # UTILS
 # ============================================================================
 
+@_leveled("info")
 def display_separator():
     """Simple separator"""
-    rprint()
+    _emit()
 
+@_leveled("info")
 def display_header(text: str):
     """Section header"""
-    rprint(f"\n[bold blue]{text}[/bold blue]")
+    _emit(f"\n[bold blue]{text}[/bold blue]")
 
+@_leveled("info")
 def display_subheader(text: str):
     """Subsection header"""
-    rprint(f"[bold cyan]{text}[/bold cyan]")
+    _emit(f"[bold cyan]{text}[/bold cyan]")
 
 # ============================================================================
 # SPECIAL EFFECTS
 # ============================================================================
 
+@_leveled("info")
 def display_welcome_banner():
     """Welcome banner for pipeline"""
-    rprint(Panel(
+    from rich.panel import Panel
+    _emit(Panel(
         "[bold blue]Deep Memory Research Pipeline[/bold blue]\n"
         "[cyan]I'll help you research your mem0 memories comprehensively![/cyan]",
         border_style="blue"
     ))
 
+@_leveled("info")
 def display_completion_banner(total_memories: int):
     """Completion banner"""
-    rprint(Panel(
+    from rich.panel import Panel
+    _emit(Panel(
         f"[green]Total memories in database: {total_memories}[/green]",
         border_style="green"
     ))
 
+@_leveled("info")
 def display_preview_text(text: str, max_chars: int = 200):
     """Text preview with truncation"""
     preview = text[:max_chars] + "..." if len(text) > max_chars else text
-    rprint(f"[dim]{preview}[/dim]")
+    _emit(f"[dim]{preview}[/dim]")
 
 # ============================================================================
 # QUICK START GUIDE AND ALIASES
@@ -534,44 +3120,52 @@ print(f"Found {count} items") → status_update(f"Found items", count)
 """
 
 # Direct color replacements (for codebases with existing color patterns)
+@_leveled("info")
 def print_green(message: str):
     """Green text - direct replacement for rprint('[green]...[/green]')"""
-    rprint(f"[green]{message}[/green]")
+    _emit(_styled_text(message, "green"))
 
+@_leveled("info")
 def print_red(message: str):
     """Red text - direct replacement"""
-    rprint(f"[red]{message}[/red]")
+    _emit(_styled_text(message, "red"))
 
+@_leveled("info")
 def print_yellow(message: str):
     """Yellow text - direct replacement"""
-    rprint(f"[yellow]{message}[/yellow]")
+    _emit(_styled_text(message, "yellow"))
 
+@_leveled("info")
 def print_blue(message: str):
     """Blue text - direct replacement"""
-    rprint(f"[blue]{message}[/blue]")
+    _emit(_styled_text(message, "blue"))
 
+@_leveled("info")
 def print_cyan(message: str):
     """Cyan text - direct replacement"""
-    rprint(f"[cyan]{message}[/cyan]")
+    _emit(_styled_text(message, "cyan"))
 
+@_leveled("info")
 def print_magenta(message: str):
     """Magenta text - direct replacement"""
-    rprint(f"[magenta]{message}[/magenta]")
+    _emit(_styled_text(message, "magenta"))
 
+@_leveled("info")
 def print_dim(message: str):
     """Dim text - direct replacement"""
-    rprint(f"[dim]{message}[/dim]")
+    _emit(_styled_text(message, "dim"))
 
+@_leveled("info")
 def print_bold(message: str):
     """Bold text - direct replacement"""
-    rprint(f"[bold]{message}[/bold]")
+    _emit(_styled_text(message, "bold"))
 
 # ============================================================================
 # UNIVERSAL COMPATIBILITY FUNCTIONS
 # ============================================================================
 
 def display_log(message: str, level: str = "info"):
-    """Universal logging function - works like any logger"""
+    """Universal logging function - works like any logger (filtered by set_level)"""
     level_map = {
         "info": display_info, "success": display_success, "warning": display_warning,
         "error": display_error, "debug": display_debug, "progress": display_progress_msg
@@ -579,6 +3173,7 @@ def display_log(message: str, level: str = "info"):
     func = level_map.get(level, display_info)
     func(message)
 
+@_leveled("info")
 def display_any(data: Any, title: str = "Data"):
     """Automatically choose best display method for any data type"""
     if isinstance(data, dict):
@@ -602,4 +3197,24 @@ def display_any(data: Any, title: str = "Data"):
 
 def display_replacement(*args, **kwargs):
     """Drop-in replacement for rprint() calls"""
-    rprint(*args, **kwargs)
\ No newline at end of file
+    # rich.print always flushes; flush= is accepted for compatibility only
+    kwargs.pop("flush", None)
+    if kwargs.get("file") is not None:
+        # An explicit stream bypasses batching and sinks, as with rprint
+        rprint(*args, **kwargs)
+        return
+    kwargs.pop("file", None)
+    _emit(*args, **kwargs)
+
+# The display and print helpers, the configuration API and the rich components
+# callers use with them; the light lazily imported components are resolved
+# through __getattr__. Modules and typing names stay out of star-imports.
+__all__ = [
+    "rprint", "console", "Console", "Text",
+    "set_level", "is_enabled", "set_json_backend", "enable_json_output", "disable_json_output",
+    "set_plain_output", "set_formatter", "FileSink", "RingBufferSink", "add_sink", "remove_sink",
+    "enable_async_output", "disable_async_output", "flush_output",
+    "enable_coalescing", "disable_coalescing", "flush_coalesced", "aio", "LiveTable",
+] + [name for name in globals() if name.startswith(("display_", "print_"))] + [
+    name for name, module in _LAZY_IMPORTS.items() if module not in _HEAVY_MODULES
+]